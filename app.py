@@ -1,20 +1,44 @@
 import os
 import streamlit as st
-import requests
+import asyncio
 import base64
+import binascii
+import logging
 import re
-from dotenv import load_dotenv
-from typing import Dict, List, Optional, Tuple
-from PIL import Image
-from io import BytesIO
+from typing import Dict, List, Optional, Sequence, Tuple
 
-# Load environment variables from .env file
-load_dotenv()
+from assets import image_base64, load_environment
+from card_cache import get_card_cache
+from catalog import CatalogSnapshot, ReadmeInfo, get_catalog_store
+from facets import (
+    ACTIVITY_WINDOWS,
+    ARCHIVED_OPTIONS,
+    PRIVACY_OPTIONS,
+    SORT_OPTIONS,
+    FacetFilters,
+)
+from github_client import GitHubRequestCancelled, GitHubRequestError, get_github_client
+from infinite_grid import WINDOW_SIZE, infinite_grid, requested_window
+from metrics import get_metrics, start_metrics_server
+from styles import CARD_CSS, FONT_AWESOME_LINK, page_styles
+from webhook import start_webhook_server
+
+# Load environment variables from .env file (once per process; this script reruns per interaction)
+load_environment()
 
 # Configuration
 ORG_NAME = 'alphatechlogics'
+GITHUB_API_URL = os.getenv("GITHUB_API_URL", "https://api.github.com").rstrip('/')
 REPOS_PER_PAGE = 8  # 2 columns × 4 rows
 COLS_PER_ROW = 2
+METRICS_PORT = os.getenv("METRICS_PORT")  # Serve /metrics on this port when set
+DEBUG_PANEL = os.getenv("DASHBOARD_DEBUG", "").lower() in ("1", "true", "yes")
+# Read the catalog from a snapshot published by refresher.py instead of calling GitHub
+CATALOG_SNAPSHOT_PATH = os.getenv("CATALOG_SNAPSHOT_PATH")
+BROWSE_MODES = ["Pages", "Infinite Scroll"]
+INFINITE_GRID_KEY = "infinite_grid"
+
+logger = logging.getLogger(__name__)
 
 class GitHubProjectsDashboard:
     def __init__(self):
@@ -32,6 +56,17 @@ class GitHubProjectsDashboard:
             pass
         return token
     
+    def _get_webhook_secret(self) -> Optional[str]:
+        """Get the webhook secret from environment variable or Streamlit secrets"""
+        secret = os.getenv("WEBHOOK_SECRET")
+        try:
+            secret_value = st.secrets.get("WEBHOOK_SECRET")
+            if secret_value:
+                secret = secret_value
+        except Exception:
+            pass
+        return secret
+    
     def _setup_headers(self) -> Dict[str, str]:
         """Set up headers for GitHub API requests"""
         headers = {
@@ -42,436 +77,140 @@ class GitHubProjectsDashboard:
             headers["Authorization"] = f"Bearer {self.github_token}"
         return headers
     
-    def fetch_repositories(self) -> List[Dict]:
-        """Fetch all repositories (public and private) from GitHub"""
+    def fetch_repositories(self) -> Optional[List[Dict]]:
+        """Fetch all repositories (public and private) from GitHub.
+        
+        Returns ``None`` if any page fails, so a partial listing is never cached as the catalog.
+        """
+        metrics = get_metrics()
         all_repos = []
-        page = 1
-        
-        while True:
-            # Fetch both public and private repos
-            url = f'https://api.github.com/orgs/{ORG_NAME}/repos'
-            params = {
-                'type': 'all',  # Include both public and private
-                'sort': 'updated',
-                'direction': 'desc',
-                'per_page': 100,
-                'page': page
-            }
-            
-            response = requests.get(url, headers=self.headers, params=params)
-            
-            if response.status_code != 200:
-                st.error(f"Failed to fetch repositories: {response.status_code}")
-                if response.status_code == 401:
-                    st.error("Authentication failed. Please check your GitHub token.")
-                break
-            
-            repos = response.json()
-            if not repos:
-                break
+        
+        # Fetch both public and private repos
+        url = f'{GITHUB_API_URL}/orgs/{ORG_NAME}/repos'
+        params = {
+            'type': 'all',  # Include both public and private
+            'sort': 'updated',
+            'direction': 'desc',
+            'per_page': 100,
+        }
+        
+        with metrics.span('fetch_repositories'):
+            # Pages after the first are fetched concurrently. The crawl fills the shared
+            # catalog for every session, so one session navigating away doesn't cancel it
+            responses = get_github_client().fetch_pages(url, self.headers, params, cancellable=False)
+            for response in responses:
+                metrics.record_github_response('org_repos', response)
                 
-            all_repos.extend(repos)
-            page += 1
+                if response.status_code != 200:
+                    logger.warning("Failed to fetch repositories: HTTP %s", response.status_code)
+                    st.error(f"Failed to fetch repositories: {response.status_code}")
+                    if response.status_code == 401:
+                        st.error("Authentication failed. Please check your GitHub token.")
+                    return None
+                
+                all_repos.extend(response.json())
         
         return all_repos
     
     def extract_readme_info(self, repo_name: str) -> Tuple[Optional[str], Optional[str]]:
         """Extract Streamlit URL and first image from README.md file"""
-        readme_url = f'https://api.github.com/repos/{ORG_NAME}/{repo_name}/readme'
+        result = self.fetch_readme_info(repo_name)
+        return (result and result[0]) or (None, None)
+    
+    def fetch_readme_info(self, repo_name: str, etag: Optional[str] = None) -> Optional[Tuple[Optional[ReadmeInfo], Optional[str]]]:
+        """Fetch and parse a README, revalidating with ``etag`` when one is given.
+        
+        Returns the parsed info and the response's ETag; the info is ``None``
+        when GitHub answers 304 Not Modified. Conditional requests that come
+        back 304 do not count against the rate limit. Returns ``None`` instead
+        of a pair when the fetch failed for a reason other than a missing README.
+        """
+        return get_github_client().run(self._fetch_readme_info(repo_name, etag))
+    
+    def fetch_readme_infos(self, lookups: List[Tuple[str, Optional[str]]]) -> List[Optional[Tuple[Optional[ReadmeInfo], Optional[str]]]]:
+        """``fetch_readme_info`` for several (repo_name, etag) pairs, all in flight at once"""
+        return get_github_client().run(self._gather_readme_infos(lookups))
+    
+    async def _gather_readme_infos(self, lookups: List[Tuple[str, Optional[str]]]) -> List[Optional[Tuple[Optional[ReadmeInfo], Optional[str]]]]:
+        return await asyncio.gather(*(self._fetch_readme_info(repo_name, etag) for repo_name, etag in lookups))
+    
+    async def _fetch_readme_info(self, repo_name: str, etag: Optional[str]) -> Optional[Tuple[Optional[ReadmeInfo], Optional[str]]]:
+        metrics = get_metrics()
+        readme_url = f'{GITHUB_API_URL}/repos/{ORG_NAME}/{repo_name}/readme'
+        headers = dict(self.headers, **{'If-None-Match': etag}) if etag else self.headers
+        
+        with metrics.span('readme_fetch'):
+            try:
+                response = await get_github_client().get(readme_url, headers)
+                metrics.record_github_response('readme', response)
+                if response.status_code == 304:
+                    return None, etag
+                if response.status_code == 200:
+                    readme_data = response.json()
+                    # Decode base64 content
+                    content = base64.b64decode(readme_data['content']).decode('utf-8')
+                    return self.parse_readme(repo_name, content), response.headers.get('ETag')
+                if response.status_code == 404:
+                    # The repository has no README; that answer is as cacheable as a README
+                    return (None, None), None
+                # Rate limits and server errors are temporary, so don't let them be cached
+                metrics.inc('readme_errors_total', error=f'HTTP {response.status_code}')
+                logger.warning("Failed to read README for %s: HTTP %s", repo_name, response.status_code)
+            except (GitHubRequestError, ValueError, KeyError, binascii.Error) as e:
+                # Keep the UI clean, but make the failure visible in logs and metrics
+                metrics.inc('readme_errors_total', error=type(e).__name__)
+                logger.warning("Failed to read README for %s: %s", repo_name, e)
+        
+        return None
+    
+    def parse_readme(self, repo_name: str, content: str) -> ReadmeInfo:
+        """Find the first Streamlit URL and the first image in README content"""
+        # Look for Streamlit URLs in various formats
+        streamlit_url = None
+        streamlit_patterns = [
+            r'https://[^.]+\.streamlit\.app[^\s\)]*',
+            r'https://share\.streamlit\.io/[^\s\)]*',
+            r'\[.*?\]\((https://[^.]+\.streamlit\.app[^\)]*)\)',
+            r'\[.*?\]\((https://share\.streamlit\.io[^\)]*)\)'
+        ]
+        
+        for pattern in streamlit_patterns:
+            matches = re.findall(pattern, content, re.IGNORECASE)
+            if matches:
+                streamlit_url = matches[0]
+                break
         
-        try:
-            response = requests.get(readme_url, headers=self.headers)
-            if response.status_code == 200:
-                readme_data = response.json()
-                # Decode base64 content
-                content = base64.b64decode(readme_data['content']).decode('utf-8')
-                
-                # Look for Streamlit URLs in various formats
-                streamlit_url = None
-                streamlit_patterns = [
-                    r'https://[^.]+\.streamlit\.app[^\s\)]*',
-                    r'https://share\.streamlit\.io/[^\s\)]*',
-                    r'\[.*?\]\((https://[^.]+\.streamlit\.app[^\)]*)\)',
-                    r'\[.*?\]\((https://share\.streamlit\.io[^\)]*)\)'
-                ]
-                
-                for pattern in streamlit_patterns:
-                    matches = re.findall(pattern, content, re.IGNORECASE)
-                    if matches:
-                        streamlit_url = matches[0]
-                        break
-                
-                # Look for images in README
-                image_url = None
-                image_patterns = [
-                    r'!\[.*?\]\((https://[^\)]+\.(?:png|jpg|jpeg|gif|webp|svg))\)',
-                    r'!\[.*?\]\(([^)]+\.(?:png|jpg|jpeg|gif|webp|svg))\)',
-                    r'<img[^>]+src=["\']([^"\']+)["\'][^>]*>',
-                ]
-                
-                for pattern in image_patterns:
-                    matches = re.findall(pattern, content, re.IGNORECASE)
-                    if matches:
-                        img_url = matches[0]
-                        # Convert relative URLs to absolute
-                        if not img_url.startswith('http'):
-                            if img_url.startswith('./'):
-                                img_url = img_url[2:]
-                            image_url = f'https://raw.githubusercontent.com/{ORG_NAME}/{repo_name}/main/{img_url}'
-                        else:
-                            image_url = img_url
-                        break
-                
-                return streamlit_url, image_url
-                
-        except Exception as e:
-            pass  # Silently handle errors to avoid cluttering the UI
+        # Look for images in README
+        image_url = None
+        image_patterns = [
+            r'!\[.*?\]\((https://[^\)]+\.(?:png|jpg|jpeg|gif|webp|svg))\)',
+            r'!\[.*?\]\(([^)]+\.(?:png|jpg|jpeg|gif|webp|svg))\)',
+            r'<img[^>]+src=["\']([^"\']+)["\'][^>]*>',
+        ]
+        
+        for pattern in image_patterns:
+            matches = re.findall(pattern, content, re.IGNORECASE)
+            if matches:
+                img_url = matches[0]
+                # Convert relative URLs to absolute
+                if not img_url.startswith('http'):
+                    if img_url.startswith('./'):
+                        img_url = img_url[2:]
+                    image_url = f'https://raw.githubusercontent.com/{ORG_NAME}/{repo_name}/main/{img_url}'
+                else:
+                    image_url = img_url
+                break
         
-        return None, None
+        return streamlit_url, image_url
     
     def get_base64_image(self, image_path: str) -> str:
         """Convert an image to a Base64 string"""
-        try:
-            with open(image_path, "rb") as image_file:
-                return base64.b64encode(image_file.read()).decode()
-        except FileNotFoundError:
-            # Return a placeholder or empty string if image not found
-            return ""
+        return image_base64(image_path)
     
     def render_custom_css(self, logo_base64: str):
         """Render custom CSS styles"""
-        st.markdown(
-            '<link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0-beta3/css/all.min.css">',
-            unsafe_allow_html=True
-        )
-        
-        st.markdown(
-            f"""
-            <style>
-            @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
-            
-            body {{
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                font-family: 'Inter', sans-serif;
-                margin: 0;
-                padding: 0;
-            }}
-
-            .main > div {{
-                padding-top: 2rem;
-            }}
-
-            .header {{
-                background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%);
-                background-image: url("data:image/png;base64,{logo_base64}");
-                background-repeat: no-repeat;
-                background-position: center;
-                background-size: contain;
-                color: white;
-                padding: 60px 40px;
-                text-align: center;
-                border-radius: 20px;
-                margin-bottom: 40px;
-                box-shadow: 0 20px 40px rgba(0,0,0,0.1);
-            }}
-
-            .org-info {{
-                background: rgba(255, 255, 255, 0.95);
-                backdrop-filter: blur(20px);
-                padding: 40px;
-                border-radius: 20px;
-                margin-bottom: 40px;
-                box-shadow: 0 20px 40px rgba(0,0,0,0.1);
-                border: 1px solid rgba(255,255,255,0.2);
-            }}
-            
-            .org-info h2, .org-info h3 {{
-                color: #6366f1;
-                font-weight: 600;
-            }}
-
-            .filter-container {{
-                background: rgba(255, 255, 255, 0.95);
-                backdrop-filter: blur(20px);
-                padding: 30px;
-                border-radius: 20px;
-                margin-bottom: 30px;
-                box-shadow: 0 10px 30px rgba(0,0,0,0.1);
-                border: 1px solid rgba(255,255,255,0.2);
-            }}
-
-            .filter-row {{
-                display: flex;
-                gap: 20px;
-                align-items: end;
-                flex-wrap: wrap;
-                margin-top: 20px;
-            }}
-
-            .filter-group {{
-                display: flex;
-                flex-direction: column;
-                gap: 8px;
-                min-width: 150px;
-            }}
-
-            .filter-label {{
-                font-weight: 600;
-                color: #374151;
-                font-size: 14px;
-                text-transform: uppercase;
-                letter-spacing: 0.5px;
-            }}
-
-            .search-container {{
-                margin-bottom: 25px;
-            }}
-
-            .search-container input {{
-                width: 100% !important;
-                padding: 16px 20px !important;
-                border: 2px solid #e5e7eb !important;
-                border-radius: 12px !important;
-                font-size: 16px !important;
-                background: rgba(255,255,255,0.9) !important;
-                transition: all 0.3s ease !important;
-            }}
-
-            .search-container input:focus {{
-                border-color: #6366f1 !important;
-                box-shadow: 0 0 0 3px rgba(99, 102, 241, 0.1) !important;
-                outline: none !important;
-            }}
-
-            .repo-card {{
-                background: rgba(255, 255, 255, 0.95);
-                backdrop-filter: blur(20px);
-                padding: 20px;
-                margin: 15px 10px;
-                border-radius: 20px;
-                box-shadow: 0 10px 30px rgba(0,0,0,0.1);
-                transition: all 0.3s ease;
-                overflow: hidden;
-                height: 320px;
-                display: flex;
-                flex-direction: column;
-                border: 1px solid rgba(255,255,255,0.2);
-                position: relative;
-            }}
-            
-            .repo-card:hover {{
-                transform: translateY(-8px);
-                box-shadow: 0 20px 50px rgba(0,0,0,0.15);
-            }}
-
-            .repo-image {{
-                width: 100%;
-                height: 100px;
-                object-fit: cover;
-                border-radius: 12px;
-                margin-bottom: 12px;
-                background: linear-gradient(135deg, #f3f4f6 0%, #e5e7eb 100%);
-                display: flex;
-                align-items: center;
-                justify-content: center;
-                color: #9ca3af;
-                font-size: 12px;
-                border: 2px dashed #d1d5db;
-                flex-shrink: 0;
-            }}
-
-            .repo-image img {{
-                width: 100%;
-                height: 100%;
-                object-fit: cover;
-                border-radius: 12px;
-            }}
-
-            .repo-content {{
-                display: flex;
-                flex-direction: column;
-                flex-grow: 1;
-                min-height: 0;
-            }}
-            
-            .repo-card h3 {{
-                margin: 0 0 8px 0;
-                color: #1f2937;
-                font-size: 16px;
-                font-weight: 600;
-                line-height: 1.3;
-                display: flex;
-                align-items: center;
-                gap: 8px;
-                flex-shrink: 0;
-            }}
-            
-            .repo-description {{
-                color: #6b7280;
-                font-size: 13px;
-                line-height: 1.4;
-                flex-grow: 1;
-                overflow: hidden;
-                text-overflow: ellipsis;
-                display: -webkit-box;
-                -webkit-line-clamp: 3;
-                -webkit-box-orient: vertical;
-                margin-bottom: 12px;
-                min-height: 60px;
-            }}
-            
-            .repo-description.no-description {{
-                color: #9ca3af;
-                font-style: italic;
-            }}
-
-            .repo-footer {{
-                display: flex;
-                justify-content: space-between;
-                align-items: center;
-                margin-top: auto;
-                padding-top: 12px;
-                border-top: 1px solid #e5e7eb;
-                flex-shrink: 0;
-            }}
-
-            .icons {{
-                display: flex;
-                gap: 10px;
-                margin-left: auto;
-            }}
-            
-            .icons a {{
-                color: #6366f1;
-                transition: all 0.2s ease;
-                font-size: 16px;
-                text-decoration: none;
-                padding: 6px;
-                border-radius: 6px;
-                background: rgba(99, 102, 241, 0.1);
-                display: inline-flex;
-                align-items: center;
-                justify-content: center;
-                width: 32px;
-                height: 32px;
-            }}
-            
-            .icons a:hover {{
-                color: white;
-                background: #6366f1;
-                transform: scale(1.1);
-            }}
-            
-            .icons span {{
-                font-size: 16px;
-                color: #d1d5db;
-                padding: 6px;
-                border-radius: 6px;
-                background: rgba(209, 213, 219, 0.1);
-                display: inline-flex;
-                align-items: center;
-                justify-content: center;
-                width: 32px;
-                height: 32px;
-            }}
-            
-            .pagination {{
-                display: flex;
-                justify-content: center;
-                align-items: center;
-                margin: 40px 0;
-                gap: 15px;
-                padding: 20px;
-                background: rgba(255, 255, 255, 0.95);
-                backdrop-filter: blur(20px);
-                border-radius: 20px;
-                box-shadow: 0 10px 30px rgba(0,0,0,0.1);
-            }}
-            
-            .pagination-info {{
-                color: #6b7280;
-                font-size: 14px;
-                font-weight: 500;
-                margin: 0 25px;
-                background: rgba(99, 102, 241, 0.1);
-                padding: 8px 16px;
-                border-radius: 20px;
-            }}
-            
-            .private-badge {{
-                background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%);
-                color: white;
-                padding: 3px 8px;
-                border-radius: 12px;
-                font-size: 10px;
-                font-weight: 600;
-                text-transform: uppercase;
-                letter-spacing: 0.5px;
-                box-shadow: 0 2px 8px rgba(239, 68, 68, 0.3);
-                margin-left: auto;
-            }}
-            
-            .public-badge {{
-                background: linear-gradient(135deg, #22c55e 0%, #16a34a 100%);
-                color: white;
-                padding: 3px 8px;
-                border-radius: 12px;
-                font-size: 10px;
-                font-weight: 600;
-                text-transform: uppercase;
-                letter-spacing: 0.5px;
-                box-shadow: 0 2px 8px rgba(34, 197, 94, 0.3);
-                margin-left: auto;
-            }}
-
-            .projects-title {{
-                color: #1f2937;
-                font-size: 32px;
-                font-weight: 700;
-                text-align: center;
-                margin-bottom: 30px;
-                background: linear-gradient(135deg, #6366f1 0%, #8b5cf6 100%);
-                -webkit-background-clip: text;
-                -webkit-text-fill-color: transparent;
-                background-clip: text;
-            }}
-
-            /* Streamlit specific overrides */
-            .stSelectbox > div > div > div {{
-                background: rgba(255,255,255,0.9) !important;
-                border: 2px solid #e5e7eb !important;
-                border-radius: 12px !important;
-                padding: 8px 12px !important;
-            }}
-
-            .stSelectbox > div > div > div:focus-within {{
-                border-color: #6366f1 !important;
-                box-shadow: 0 0 0 3px rgba(99, 102, 241, 0.1) !important;
-            }}
-
-            .stButton > button {{
-                background: linear-gradient(135deg, #6366f1 0%, #8b5cf6 100%) !important;
-                color: white !important;
-                border: none !important;
-                border-radius: 12px !important;
-                padding: 10px 20px !important;
-                font-weight: 600 !important;
-                transition: all 0.3s ease !important;
-                box-shadow: 0 4px 15px rgba(99, 102, 241, 0.3) !important;
-            }}
-
-            .stButton > button:hover {{
-                transform: translateY(-2px) !important;
-                box-shadow: 0 8px 25px rgba(99, 102, 241, 0.4) !important;
-            }}
-
-            div[data-testid="stSidebar"] {{
-                display: none;
-            }}
-            </style>
-            """,
-            unsafe_allow_html=True
-        )
+        st.markdown(FONT_AWESOME_LINK, unsafe_allow_html=True)
+        st.markdown(page_styles(logo_base64), unsafe_allow_html=True)
     
     def render_header(self):
         """Render the header section"""
@@ -523,8 +262,44 @@ class GitHubProjectsDashboard:
         )
     
 
-    def render_repository_card(self, repo: Dict, bg_color: str):
+    def render_repository_card(self, repo: Dict, bg_color: str, theme: Optional[str] = None):
         """Render a single repository card"""
+        with get_metrics().span('render_card'):
+            st.markdown(self.card_html(repo, theme), unsafe_allow_html=True)
+    
+    def prefetch_readmes(self, repos: List[Dict]):
+        """Load missing or expired README metadata for ``repos`` concurrently rather than card by card"""
+        store = get_catalog_store()
+        names = [repo.get('name', 'Unnamed Repository') for repo in repos]
+        stale = [name for name in names if not store.readme_is_fresh(name)]
+        if stale:
+            store.readme_infos(stale, self.fetch_readme_infos)
+    
+    def card_html(self, repo: Dict, theme: Optional[str] = None) -> str:
+        """Card markup for a repository, shared across sessions until the repository or its README changes"""
+        repo_name = repo.get('name', 'Unnamed Repository')
+        store = get_catalog_store()
+        readme = None
+        if not store.readme_is_fresh(repo_name):
+            # Revalidate first so a changed README bumps its version before the lookup
+            readme = store.readme_info(repo_name, self.fetch_readme_info)
+        key = (
+            repo.get('id'),
+            repo.get('updated_at'),
+            store.readme_version(repo_name),
+            theme,
+        )
+        cache = get_card_cache()
+        html = cache.get(key)
+        if html is None:
+            html = self._build_card_html(repo, readme)
+            if store.readme_is_fresh(repo_name):
+                # A card built while the README fetch was failing is not cached; it is rebuilt once the fetch succeeds
+                cache.put(key, html)
+        return html
+    
+    def _build_card_html(self, repo: Dict, readme: Optional[ReadmeInfo] = None) -> str:
+        """Build the card markup from scratch"""
         repo_name = repo.get('name', 'Unnamed Repository')
         repo_url = repo.get('html_url', '#')
         
@@ -541,8 +316,8 @@ class GitHubProjectsDashboard:
         
         is_private = repo.get('private', False)
         
-        # Extract Streamlit URL and image from README
-        _, image_url = self.extract_readme_info(repo_name)
+        # Extract Streamlit URL and image from README (cached until a webhook or the TTL invalidates it)
+        _, image_url = readme or get_catalog_store().readme_info(repo_name, self.fetch_readme_info)
         
         # Create privacy badge
         privacy_badge = f'<span class="private-badge">Private</span>' if is_private else f'<span class="public-badge">Public</span>'
@@ -559,8 +334,7 @@ class GitHubProjectsDashboard:
         else:
             image_section = '<div class="repo-image">📷 No preview available</div>'
         
-        st.markdown(
-            f"""
+        return f"""
             <div class="repo-card">
                 {image_section}
                 <div class="repo-content">
@@ -575,44 +349,21 @@ class GitHubProjectsDashboard:
                     </div>
                 </div>
             </div>
-            """,
-            unsafe_allow_html=True
-        )
+            """
+    
+    def load_catalog(self) -> CatalogSnapshot:
+        """Return the shared catalog snapshot, crawling GitHub only when it is stale"""
+        return get_catalog_store().get(self.fetch_repositories)
     
-    def apply_filter_and_sort(self, repos: List[Dict], sort_option: str, privacy_filter: str, search_query: str) -> List[Dict]:
+    def apply_filter_and_sort(self, snapshot: CatalogSnapshot, sort_option: str, privacy_filter: str, search_query: str, facet_filters: Optional[FacetFilters] = None) -> Sequence[Dict]:
         """Apply filtering and sorting to repositories"""
-        # First, filter out forks if they don't have descriptions
-        filtered_repos = [repo for repo in repos if repo.get('description') or not repo.get('fork', True)]
-        
-        # Apply privacy filter
-        if privacy_filter == "Public Only":
-            filtered_repos = [repo for repo in filtered_repos if not repo.get('private', False)]
-        elif privacy_filter == "Private Only":
-            filtered_repos = [repo for repo in filtered_repos if repo.get('private', False)]
-        # "All" doesn't need additional filtering
-        
-        # Apply search filter
-        if search_query:
-            search_query_lower = search_query.lower()
-            filtered_repos = [
-                repo for repo in filtered_repos 
-                if (search_query_lower in repo.get('name', '').lower()) or 
-                   (repo.get('description') and isinstance(repo.get('description'), str) and search_query_lower in repo.get('description', '').lower())
-            ]
-        
-        # Apply sorting
-        if sort_option == "Latest":
-            return sorted(filtered_repos, key=lambda x: x.get('updated_at', ''), reverse=True)
-        elif sort_option == "Oldest":
-            return sorted(filtered_repos, key=lambda x: x.get('updated_at', ''))
-        elif sort_option == "A-Z":
-            return sorted(filtered_repos, key=lambda x: x.get('name', '').lower())
-        elif sort_option == "Z-A":
-            return sorted(filtered_repos, key=lambda x: x.get('name', '').lower(), reverse=True)
-        else:
-            return filtered_repos
+        with get_metrics().span('filter_and_sort'):
+            index = snapshot.index
+            # Forks without descriptions, privacy, search and facets are all bitmap intersections
+            bitmap = index.match(privacy_filter, search_query, facet_filters or FacetFilters())
+            return index.select(bitmap, sort_option)
     
-    def render_filter_section(self) -> Tuple[str, str, str]:
+    def render_filter_section(self, snapshot: CatalogSnapshot) -> Tuple[str, str, str, FacetFilters]:
         """Render the filter section and return selected filters"""
         st.markdown('<h2 class="projects-title">Our Projects</h2>', unsafe_allow_html=True)
         
@@ -621,7 +372,7 @@ class GitHubProjectsDashboard:
         # Search bar
         st.markdown('<div class="search-container">', unsafe_allow_html=True)
         search_query = st.text_input(
-            "",
+            "Search",
             placeholder="🔍 Search repositories by name or description...",
             key="search_input",
             label_visibility="collapsed"
@@ -636,10 +387,9 @@ class GitHubProjectsDashboard:
         with col1:
             st.markdown('<div class="filter-group">', unsafe_allow_html=True)
             st.markdown('<div class="filter-label">Sort By</div>', unsafe_allow_html=True)
-            sort_options = ["Latest", "Oldest", "A-Z", "Z-A"]
             selected_sort = st.selectbox(
-                "",
-                sort_options,
+                "Sort By",
+                SORT_OPTIONS,
                 index=0,
                 key="repo_sort",
                 label_visibility="collapsed"
@@ -649,10 +399,9 @@ class GitHubProjectsDashboard:
         with col2:
             st.markdown('<div class="filter-group">', unsafe_allow_html=True)
             st.markdown('<div class="filter-label">Visibility</div>', unsafe_allow_html=True)
-            privacy_options = ["All", "Public Only", "Private Only"]
             selected_privacy = st.selectbox(
-                "",
-                privacy_options,
+                "Visibility",
+                PRIVACY_OPTIONS,
                 index=0,
                 key="privacy_filter",
                 label_visibility="collapsed"
@@ -663,10 +412,102 @@ class GitHubProjectsDashboard:
             st.markdown("")  # Spacer
         
         st.markdown('</div>', unsafe_allow_html=True)  # Close filter-row
+        
+        facet_filters = self.render_facet_filters(snapshot, selected_privacy, search_query)
+        
         st.markdown('</div>', unsafe_allow_html=True)  # Close filter-container
         
-        return selected_sort, selected_privacy, search_query
-            
+        return selected_sort, selected_privacy, search_query, facet_filters
+    
+    def render_facet_filters(self, snapshot: CatalogSnapshot, privacy_filter: str, search_query: str) -> FacetFilters:
+        """Render language, topic, archived, stars and activity facets with live counts"""
+        index = snapshot.index
+        
+        # Selections live in session state rather than widget keys: the counts are part of
+        # each option's label, so the widgets are recreated whenever the counts change
+        current = st.session_state.get("facet_filters", FacetFilters())
+        counts = index.facet_counts(privacy_filter, search_query, current)
+        
+        language_options = sorted(index.languages, key=lambda value: (-index.languages[value].bit_count(), value.lower()))
+        topic_options = sorted(index.topics, key=lambda value: (-index.topics[value].bit_count(), value.lower()))
+        activity_options = [None] + ACTIVITY_WINDOWS
+        
+        st.markdown('<div class="filter-row">', unsafe_allow_html=True)
+        col1, col2, col3 = st.columns([2, 2, 1])
+        
+        with col1:
+            st.markdown('<div class="filter-label">Language</div>', unsafe_allow_html=True)
+            languages = st.multiselect(
+                "Language",
+                language_options,
+                default=[value for value in current.languages if value in index.languages],
+                format_func=lambda value: f"{value} ({counts['language'].get(value, 0)})",
+                label_visibility="collapsed"
+            )
+        
+        with col2:
+            st.markdown('<div class="filter-label">Topic</div>', unsafe_allow_html=True)
+            topics = st.multiselect(
+                "Topic",
+                topic_options,
+                default=[value for value in current.topics if value in index.topics],
+                format_func=lambda value: f"{value} ({counts['topic'].get(value, 0)})",
+                label_visibility="collapsed"
+            )
+        
+        with col3:
+            st.markdown('<div class="filter-label">Archived</div>', unsafe_allow_html=True)
+            archived = st.selectbox(
+                "Archived",
+                ARCHIVED_OPTIONS,
+                index=ARCHIVED_OPTIONS.index(current.archived),
+                format_func=lambda value: f"{value} ({counts['archived'][value]})",
+                label_visibility="collapsed"
+            )
+        
+        col4, col5 = st.columns([3, 2])
+        
+        with col4:
+            st.markdown('<div class="filter-label">Stars</div>', unsafe_allow_html=True)
+            stars = None
+            if index.max_stars > 0:
+                low, high = current.stars or (0, index.max_stars)
+                selected_stars = st.slider(
+                    "Stars",
+                    min_value=0,
+                    max_value=index.max_stars,
+                    value=(min(low, index.max_stars), min(high, index.max_stars)),
+                    label_visibility="collapsed"
+                )
+                if tuple(selected_stars) != (0, index.max_stars):
+                    stars = tuple(selected_stars)
+        
+        with col5:
+            st.markdown('<div class="filter-label">Active Within</div>', unsafe_allow_html=True)
+            active_within = st.selectbox(
+                "Active Within",
+                activity_options,
+                index=activity_options.index(current.active_within),
+                format_func=lambda days: "Any time" if days is None else f"Last {days} days ({counts['activity'][days]})",
+                label_visibility="collapsed"
+            )
+        
+        st.markdown('</div>', unsafe_allow_html=True)  # Close filter-row
+        
+        selected = FacetFilters(
+            languages=languages,
+            topics=topics,
+            archived=archived,
+            stars=stars,
+            active_within=active_within,
+        )
+        
+        # Rerun once so the counts shown match the new selection before the next interaction
+        if selected.key() != current.key():
+            st.session_state.facet_filters = selected
+            st.rerun()
+        
+        return selected
     
     def render_pagination(self, current_page: int, total_pages: int, total_repos: int):
         """Render pagination controls"""
@@ -702,10 +543,74 @@ class GitHubProjectsDashboard:
                     st.session_state.current_page = current_page + 1
                     st.rerun()
     
+    def render_repository_grid(self, page_repos: List[Dict], theme: Optional[str]):
+        """Render one page of repository cards, two per row"""
+        self.prefetch_readmes(page_repos)
+        
+        # Display repositories in grid layout
+        light_colors = ["#f7f7f7", "#e6f7ff", "#e8ffe8", "#fff0e6", "#f0f8ff", "#fdfd96"]
+        
+        # Create rows of repositories
+        rows_list = [page_repos[i:i + COLS_PER_ROW] for i in range(0, len(page_repos), COLS_PER_ROW)]
+        
+        card_index = 0
+        for row in rows_list:
+            cols = st.columns(COLS_PER_ROW)
+            for idx, repo in enumerate(row):
+                bg_color = light_colors[card_index % len(light_colors)]
+                card_index += 1
+                with cols[idx]:
+                    self.render_repository_card(repo, bg_color, theme)
+    
+    @st.fragment
+    def render_infinite_grid(self, filtered_repos: Sequence[Dict], filter_key: str, theme: Optional[str]):
+        """Render the filtered repositories as a virtualized, infinitely scrolling grid.
+
+        Runs as a fragment, so fetching the next window of cards reruns only
+        the grid rather than the whole page.
+        """
+        total = len(filtered_repos)
+        start = requested_window(INFINITE_GRID_KEY, filter_key, total)
+        window_repos = filtered_repos[start:start + WINDOW_SIZE]
+        try:
+            self.prefetch_readmes(window_repos)
+            cards = [self.card_html(repo, theme) for repo in window_repos]
+        except GitHubRequestCancelled:
+            # The session moved on mid-load; leave the grid as the browser has it
+            return
+        infinite_grid(cards, start, total, filter_key, CARD_CSS, COLS_PER_ROW, key=INFINITE_GRID_KEY)
+    
+    def render_debug_panel(self):
+        """Render timing spans and counters for diagnosing slow reruns"""
+        metrics = get_metrics()
+        with st.expander("Performance", expanded=False):
+            st.table(metrics.span_summary())
+            counters = {
+                "GitHub API calls": metrics.counter_total('github_api_requests_total'),
+                "304 Not Modified": metrics.counter_total('github_not_modified_total'),
+                "Catalog cache hits": metrics.counter_total('cache_hits_total', cache='catalog'),
+                "Catalog cache misses": metrics.counter_total('cache_misses_total', cache='catalog'),
+                "README cache hits": metrics.counter_total('cache_hits_total', cache='readme'),
+                "README cache misses": metrics.counter_total('cache_misses_total', cache='readme'),
+                "README errors": metrics.counter_total('readme_errors_total'),
+            }
+            st.table([{"metric": name, "value": int(value)} for name, value in counters.items()])
+            st.code(metrics.render_prometheus(), language="text")
+    
     def run(self):
         """Main function to run the dashboard"""
-        # Set page configuration
-        st.set_page_config(page_title="AlphaTech Logics Dashboard", layout="wide")
+        if CATALOG_SNAPSHOT_PATH:
+            # Worker mode: the refresher crawls GitHub and receives webhooks for every worker
+            get_catalog_store().attach_snapshot(CATALOG_SNAPSHOT_PATH)
+        else:
+            # Receive GitHub webhooks for targeted cache invalidation when a secret is configured
+            webhook_secret = self._get_webhook_secret()
+            if webhook_secret:
+                start_webhook_server(ORG_NAME, webhook_secret)
+        
+        # Expose Prometheus metrics when a port is configured
+        if METRICS_PORT:
+            start_metrics_server(int(METRICS_PORT))
         
         # Get Base64 string of the logo image
         logo_base64 = self.get_base64_image("black_without-tagline.png")
@@ -717,37 +622,49 @@ class GitHubProjectsDashboard:
         self.render_header()
         self.render_org_info()
         
+        # Process-wide timings and counters, opt-in via DASHBOARD_DEBUG or ?debug=1
+        if DEBUG_PANEL or st.query_params.get("debug") == "1":
+            self.render_debug_panel()
+        
+        # Fetch repositories (shared across sessions until the catalog goes stale)
+        with st.spinner("Loading repositories..."):
+            snapshot = self.load_catalog()
+        
+        if not snapshot.repos:
+            st.error("No repositories found or failed to fetch repositories.")
+            return
+        
         # Render filter section and get selected filters
-        selected_sort, selected_privacy, search_query = self.render_filter_section()
+        selected_sort, selected_privacy, search_query, facet_filters = self.render_filter_section(snapshot)
         
         # Initialize session state for pagination
         if 'current_page' not in st.session_state:
             st.session_state.current_page = 1
         
         # Reset page when filters change
-        filter_key = f"{selected_sort}_{selected_privacy}_{search_query}"
+        filter_key = f"{selected_sort}_{selected_privacy}_{search_query}_{facet_filters.key()}"
         if 'previous_filter_key' not in st.session_state:
             st.session_state.previous_filter_key = filter_key
         elif st.session_state.previous_filter_key != filter_key:
             st.session_state.current_page = 1
             st.session_state.previous_filter_key = filter_key
         
-        # Fetch repositories
-        with st.spinner("Loading repositories..."):
-            repos = self.fetch_repositories()
-        
-        if not repos:
-            st.error("No repositories found or failed to fetch repositories.")
-            return
-        
         # Apply filters and sorting
-        filtered_repos = self.apply_filter_and_sort(repos, selected_sort, selected_privacy, search_query)
+        filtered_repos = self.apply_filter_and_sort(snapshot, selected_sort, selected_privacy, search_query, facet_filters)
         
         # Check if no repositories match the filter
         if not filtered_repos:
             st.warning("No repositories match your current filters. Try adjusting your search criteria.")
             return
         
+        # Part of every card's cache key; read once instead of per card
+        theme = st.get_option('theme.base')
+        
+        browse_mode = st.radio("Browse", BROWSE_MODES, horizontal=True, key="browse_mode", label_visibility="collapsed")
+        if browse_mode == "Infinite Scroll":
+            self.render_infinite_grid(filtered_repos, filter_key, theme)
+            return
+        
         # Calculate pagination
         total_repos = len(filtered_repos)
         total_pages = (total_repos + REPOS_PER_PAGE - 1) // REPOS_PER_PAGE
@@ -763,20 +680,11 @@ class GitHubProjectsDashboard:
         end_idx = start_idx + REPOS_PER_PAGE
         page_repos = filtered_repos[start_idx:end_idx]
         
-        # Display repositories in grid layout
-        light_colors = ["#f7f7f7", "#e6f7ff", "#e8ffe8", "#fff0e6", "#f0f8ff", "#fdfd96"]
-        
-        # Create rows of repositories
-        rows_list = [page_repos[i:i + COLS_PER_ROW] for i in range(0, len(page_repos), COLS_PER_ROW)]
-        
-        card_index = 0
-        for row in rows_list:
-            cols = st.columns(COLS_PER_ROW)
-            for idx, repo in enumerate(row):
-                bg_color = light_colors[card_index % len(light_colors)]
-                card_index += 1
-                with cols[idx]:
-                    self.render_repository_card(repo, bg_color)
+        try:
+            self.render_repository_grid(page_repos, theme)
+        except GitHubRequestCancelled:
+            # The session reran, stopped or disconnected while READMEs loaded; Streamlit takes it from here
+            return
         
         # Render pagination if there are multiple pages
         if total_pages > 1:
@@ -785,5 +693,7 @@ class GitHubProjectsDashboard:
 
 # Run the dashboard
 if __name__ == "__main__":
+    # Set page configuration first: reading st.secrets without a secrets file already writes to the page
+    st.set_page_config(page_title="AlphaTech Logics Dashboard", layout="wide")
     dashboard = GitHubProjectsDashboard()
     dashboard.run()
\ No newline at end of file
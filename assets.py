@@ -0,0 +1,25 @@
+import base64
+import os
+from functools import lru_cache
+
+from dotenv import load_dotenv
+
+# Static files ship next to the app, whatever the working directory is
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+@lru_cache(maxsize=None)
+def load_environment() -> bool:
+    """Load the .env file once per process rather than on every rerun"""
+    return load_dotenv()
+
+
+@lru_cache(maxsize=None)
+def image_base64(image_path: str) -> str:
+    """Base64 contents of an image, read from disk once per process"""
+    try:
+        with open(os.path.join(ROOT_DIR, image_path), "rb") as image_file:
+            return base64.b64encode(image_file.read()).decode()
+    except FileNotFoundError:
+        # Return a placeholder or empty string if image not found
+        return ""
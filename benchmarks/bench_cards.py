@@ -0,0 +1,107 @@
+"""Benchmark card rendering per page with and without the shared card cache.
+
+Loads a catalog scaled from the recorded fixtures, warms the README
+metadata from the recorded README, then builds the card markup for every
+page of ``REPOS_PER_PAGE`` repositories, first with the card cache disabled
+and then with it warm::
+
+    python -m benchmarks.bench_cards --repos 1000 --repeat 5
+
+For the end-to-end effect on reruns, run ``benchmarks.bench_dashboard`` once
+with ``CARD_CACHE_SIZE=0`` and once without.
+"""
+import argparse
+import base64
+import json
+import os
+import statistics
+import time
+from typing import Dict, List
+
+from benchmarks.bench_dashboard import ORG_NAME, ROOT_DIR
+from benchmarks.stub_github import build_catalog, load_fixture
+
+
+def time_pages(dashboard, pages: List[List[Dict]], repeat: int) -> List[float]:
+    """Seconds to build the markup of each page, best of ``repeat`` passes"""
+    best = [float('inf')] * len(pages)
+    for _ in range(repeat):
+        for i, page in enumerate(pages):
+            start = time.perf_counter()
+            ''.join(dashboard.card_html(repo) for repo in page)
+            best[i] = min(best[i], time.perf_counter() - start)
+    return best
+
+
+def summarize(samples: List[float]) -> Dict:
+    return {
+        'median_seconds_per_page': statistics.median(samples),
+        'mean_seconds_per_page': statistics.mean(samples),
+        'max_seconds_per_page': max(samples),
+    }
+
+
+def bench_cards(repos: int, repeat: int) -> Dict:
+    from app import REPOS_PER_PAGE, GitHubProjectsDashboard
+    from card_cache import get_card_cache
+    from catalog import get_catalog_store
+
+    dashboard = GitHubProjectsDashboard()
+    store = get_catalog_store()
+    store.clear()
+    catalog = store.replace(build_catalog(ORG_NAME, repos)).repos
+
+    # Rendering never waits on GitHub here: README metadata is parsed from the recording
+    readme = base64.b64decode(load_fixture('readme.json')['content']).decode('utf-8')
+    for repo in catalog:
+        store.readme_info(repo['name'], lambda name, etag: (dashboard.parse_readme(name, readme), None))
+    pages = [catalog[i:i + REPOS_PER_PAGE] for i in range(0, len(catalog), REPOS_PER_PAGE)]
+
+    cache = get_card_cache()
+    maxsize = cache.maxsize
+    try:
+        cache.clear()
+        cache.maxsize = 0
+        uncached = time_pages(dashboard, pages, repeat)
+
+        cache.maxsize = max(maxsize, len(catalog))
+        time_pages(dashboard, pages, 1)  # Fill the cache
+        cached = time_pages(dashboard, pages, repeat)
+    finally:
+        cache.maxsize = maxsize
+        cache.clear()
+        store.clear()
+
+    return {
+        'repos': repos,
+        'pages': len(pages),
+        'uncached': summarize(uncached),
+        'cached': summarize(cached),
+        'speedup': statistics.median(uncached) / statistics.median(cached) if statistics.median(cached) else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repos', type=int, nargs='+', default=[100, 1000], help="catalog sizes to benchmark")
+    parser.add_argument('--repeat', type=int, default=5, help="passes over every page; the fastest is kept")
+    parser.add_argument('--output', help="write JSON results to this file instead of stdout")
+    args = parser.parse_args()
+
+    os.chdir(ROOT_DIR)
+    results = {
+        'benchmark': 'cards',
+        'repeat': args.repeat,
+        'results': [bench_cards(size, args.repeat) for size in args.repos],
+    }
+
+    report = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            output_file.write(report + '\n')
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
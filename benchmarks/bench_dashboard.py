@@ -0,0 +1,140 @@
+"""Benchmark the dashboard's cold, warm and interactive render paths.
+
+Runs ``app.py`` headlessly with Streamlit's ``AppTest`` against a local stub
+of the GitHub API that replays the recorded responses in ``fixtures/github``.
+Results are printed (or written) as JSON so they can be compared between
+commits::
+
+    python -m benchmarks.bench_dashboard --sizes 10 100 1000 --latency 0.05 --output bench.json
+"""
+import argparse
+import json
+import os
+import statistics
+import time
+from typing import Callable, Dict, List
+
+from streamlit.testing.v1 import AppTest
+
+from benchmarks.stub_github import StubGitHub
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(ROOT_DIR, 'app.py')
+ORG_NAME = 'alphatechlogics'
+DEFAULT_SIZES = [10, 100, 1000, 10000]
+
+
+def element_bytes(node) -> int:
+    """Serialized size of every element and block in a rendered tree"""
+    total = 0
+    proto = getattr(node, 'proto', None)
+    if proto is not None and hasattr(proto, 'ByteSize'):
+        total += proto.ByteSize()
+    for child in getattr(node, 'children', {}).values():
+        total += element_bytes(child)
+    return total
+
+
+def measure(stub: StubGitHub, at: AppTest, step: Callable[[], AppTest]) -> Dict:
+    """Time one rerun and record the upstream calls and payload it produced"""
+    stub.reset_counters()
+    start = time.perf_counter()
+    step()
+    elapsed = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    counters = stub.counters()
+    return {
+        'seconds': elapsed,
+        'api_calls': counters['requests'],
+        'upstream_bytes': counters['bytes'],
+        'browser_bytes': element_bytes(at._tree),
+    }
+
+
+def summarize(samples: List[Dict]) -> Dict:
+    """Median time plus mean counters across repeated samples"""
+    return {
+        'median_seconds': statistics.median(sample['seconds'] for sample in samples),
+        'min_seconds': min(sample['seconds'] for sample in samples),
+        'api_calls_per_rerun': statistics.mean(sample['api_calls'] for sample in samples),
+        'upstream_bytes': statistics.mean(sample['upstream_bytes'] for sample in samples),
+        'browser_bytes': statistics.mean(sample['browser_bytes'] for sample in samples),
+    }
+
+
+def click(at: AppTest, label: str) -> AppTest:
+    for button in at.button:
+        if button.label == label:
+            return button.click().run()
+    raise LookupError(f"No button labelled {label!r}")
+
+
+def bench_size(size: int, latency: float, repeat: int, timeout: float) -> Dict:
+    from card_cache import get_card_cache
+    from catalog import get_catalog_store
+
+    with StubGitHub(ORG_NAME, size, latency=latency) as stub:
+        os.environ['GITHUB_API_URL'] = stub.url
+        store = get_catalog_store()
+
+        cold = []
+        for _ in range(repeat):
+            # Rendered cards outlive the catalog; drop them too so every cold sample starts cold
+            store.clear()
+            get_card_cache().clear()
+            at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+            cold.append(measure(stub, at, at.run))
+
+        warm = [measure(stub, at, at.run) for _ in range(repeat)]
+
+        # Widgets are looked up again after every rerun; stale handles carry stale options
+        keystrokes = []
+        query = ''
+        for char in 'assistant'[:max(repeat, 1)]:
+            query += char
+            keystrokes.append(measure(stub, at, lambda: at.text_input(key='search_input').input(query).run()))
+        at.text_input(key='search_input').input('').run()
+
+        page_switches = []
+        if any(button.label == 'Next →' for button in at.button):
+            for _ in range(repeat):
+                page_switches.append(measure(stub, at, lambda: click(at, 'Next →')))
+                click(at, 'First')
+
+        return {
+            'repos': size,
+            'cold_load': summarize(cold),
+            'warm_rerun': summarize(warm),
+            'search_keystroke': summarize(keystrokes),
+            'page_switch': summarize(page_switches) if page_switches else None,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="catalog sizes to benchmark")
+    parser.add_argument('--latency', type=float, default=0.0, help="seconds added to every stub GitHub response")
+    parser.add_argument('--repeat', type=int, default=5, help="samples per measurement")
+    parser.add_argument('--timeout', type=float, default=600, help="per-rerun timeout in seconds")
+    parser.add_argument('--output', help="write JSON results to this file instead of stdout")
+    args = parser.parse_args()
+
+    os.chdir(ROOT_DIR)  # The app loads its logo relative to the working directory
+    results = {
+        'benchmark': 'dashboard',
+        'latency_seconds': args.latency,
+        'repeat': args.repeat,
+        'results': [bench_size(size, args.latency, args.repeat, args.timeout) for size in args.sizes],
+    }
+
+    report = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            output_file.write(report + '\n')
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""Profile the app's cold start: import time, server start and time-to-first-byte.
+
+Breaks ``import app`` down per module with ``python -X importtime``, then
+starts ``streamlit run app.py`` against the stub GitHub API and measures how
+long a brand-new session waits for its first rendered element and for the
+whole page, on a cold process and on a warm one::
+
+    python -m benchmarks.bench_startup --repeat 3 --sessions 5
+"""
+import argparse
+import asyncio
+import json
+import re
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from tornado.websocket import websocket_connect
+
+from benchmarks.bench_dashboard import ORG_NAME, ROOT_DIR
+from benchmarks.load_test import DashboardServer
+from benchmarks.stub_github import StubGitHub
+
+_IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+
+def import_profile(top: int) -> Dict:
+    """Per-module import cost of ``import app`` in a fresh interpreter"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import app'],
+        cwd=ROOT_DIR, capture_output=True, text=True, check=True,
+    )
+    modules = []
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            modules.append({
+                'module': name,
+                'depth': len(indent) // 2,
+                'self_ms': int(self_us) / 1000,
+                'cumulative_ms': int(cumulative_us) / 1000,
+            })
+
+    app_entry = next(module for module in modules if module['module'] == 'app')
+    # Modules app.py pulls in directly (depth 1 is everything imported while executing app)
+    direct = [module for module in modules if module['depth'] == 1]
+    return {
+        'total_ms': app_entry['cumulative_ms'],
+        'direct_imports': sorted(direct, key=lambda module: module['cumulative_ms'], reverse=True)[:top],
+        'slowest_modules': sorted(modules, key=lambda module: module['self_ms'], reverse=True)[:top],
+    }
+
+
+async def first_page(base_url: str, timeout: float) -> Dict:
+    """Open a new session and time its first element and finished page"""
+    stream_url = base_url.replace('http://', 'ws://') + '/_stcore/stream'
+    start = time.perf_counter()
+    connection = await websocket_connect(stream_url, max_message_size=64 * 1024 * 1024)
+    message = BackMsg()
+    message.rerun_script.SetInParent()
+    await connection.write_message(message.SerializeToString(), binary=True)
+
+    first_element = None
+    received = 0
+
+    async def read():
+        nonlocal first_element, received
+        while True:
+            data = await connection.read_message()
+            if data is None:
+                raise ConnectionError("Server closed the websocket")
+            received += len(data)
+            msg = ForwardMsg()
+            msg.ParseFromString(data)
+            kind = msg.WhichOneof('type')
+            if kind == 'delta' and first_element is None:
+                first_element = time.perf_counter() - start
+            elif kind == 'script_finished' and msg.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                return
+
+    try:
+        await asyncio.wait_for(read(), timeout)
+    finally:
+        connection.close()
+    return {
+        'first_element_seconds': first_element,
+        'page_seconds': time.perf_counter() - start,
+        'bytes': received,
+    }
+
+
+def summarize(samples: List[Dict], field: str) -> Dict:
+    values = [sample[field] for sample in samples]
+    return {'median': statistics.median(values), 'min': min(values), 'max': max(values)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=3, help="fresh server processes to start")
+    parser.add_argument('--sessions', type=int, default=5, help="warm sessions opened on each server")
+    parser.add_argument('--repos', type=int, default=100, help="catalog size served by the stub")
+    parser.add_argument('--top', type=int, default=15, help="modules listed in the import profile")
+    parser.add_argument('--timeout', type=float, default=120, help="per-page timeout in seconds")
+    parser.add_argument('--port', type=int, default=8599, help="port for the Streamlit server under test")
+    parser.add_argument('--output', help="write JSON results to this file instead of stdout")
+    args = parser.parse_args()
+
+    server_start, cold, warm = [], [], []
+    with StubGitHub(ORG_NAME, args.repos) as stub:
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            with DashboardServer(stub.url, args.port) as server:
+                server_start.append({'seconds': time.perf_counter() - start})
+                # The first session pays for the script compile, module imports and the catalog crawl
+                cold.append(asyncio.run(first_page(server.url, args.timeout)))
+                for _ in range(args.sessions):
+                    warm.append(asyncio.run(first_page(server.url, args.timeout)))
+
+    results = {
+        'benchmark': 'startup',
+        'python': sys.version.split()[0],
+        'import_app': import_profile(args.top),
+        'server_start_seconds': summarize(server_start, 'seconds'),
+        'cold_session': {
+            'first_element_seconds': summarize(cold, 'first_element_seconds'),
+            'page_seconds': summarize(cold, 'page_seconds'),
+        },
+        'new_session_on_warm_process': {
+            'first_element_seconds': summarize(warm, 'first_element_seconds'),
+            'page_seconds': summarize(warm, 'page_seconds'),
+            'bytes': statistics.mean(sample['bytes'] for sample in warm),
+        },
+    }
+
+    report = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            output_file.write(report + '\n')
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,311 @@
+"""Concurrent-session load test for the dashboard.
+
+Starts ``streamlit run app.py`` against a local stub of the GitHub API, then
+connects ``--sessions`` headless websocket clients that all load the page
+at once and perform a randomized but realistic sequence of search
+keystrokes, sort and visibility changes and page switches. Reports
+throughput, rerun latency percentiles, upstream call amplification and
+server memory per session as JSON::
+
+    python -m benchmarks.load_test --sessions 50 --repos 500 --latency 0.05
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from typing import Dict, List, Optional
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.Selectbox_pb2 import Selectbox
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from tornado.websocket import websocket_connect
+
+from benchmarks.bench_dashboard import APP_PATH, ORG_NAME, ROOT_DIR
+from benchmarks.stub_github import StubGitHub
+
+SEARCH_TERMS = ['pdf', 'chat', 'churn', 'react', 'atl', 'yolo', 'api']
+SORT_OPTIONS = ['Latest', 'Oldest', 'A-Z', 'Z-A']
+PRIVACY_OPTIONS = ['All', 'Public Only', 'Private Only']
+
+# Newer Streamlit versions send the selected option instead of its index
+_SELECTBOX_SENDS_STRING = 'raw_value' in Selectbox.DESCRIPTOR.fields_by_name
+
+
+class DashboardSession:
+    """One simulated viewer speaking Streamlit's websocket protocol"""
+
+    def __init__(self, base_url: str, timeout: float):
+        self.stream_url = base_url.replace('http://', 'ws://') + '/_stcore/stream'
+        self.timeout = timeout
+        self.connection = None
+        self.widgets: Dict[str, object] = {}  # label -> element proto from the last run
+        self.states: Dict[str, WidgetState] = {}  # widget id -> value sent with every rerun
+        self.bytes_received = 0
+
+    async def connect(self):
+        self.connection = await websocket_connect(self.stream_url, max_message_size=64 * 1024 * 1024)
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+
+    async def rerun(self, trigger: Optional[str] = None) -> float:
+        """Ask for a rerun with the current widget values and wait for it to finish"""
+        message = BackMsg()
+        message.rerun_script.SetInParent()
+        message.rerun_script.widget_states.widgets.extend(self.states.values())
+        if trigger is not None:
+            message.rerun_script.widget_states.widgets.append(
+                WidgetState(id=self.widgets[trigger].id, trigger_value=True)
+            )
+
+        start = time.perf_counter()
+        await self.connection.write_message(message.SerializeToString(), binary=True)
+        await asyncio.wait_for(self._read_until_finished(), self.timeout)
+        return time.perf_counter() - start
+
+    async def _read_until_finished(self):
+        self.widgets = {}
+        while True:
+            data = await self.connection.read_message()
+            if data is None:
+                raise ConnectionError("Server closed the websocket")
+            self.bytes_received += len(data)
+            msg = ForwardMsg()
+            msg.ParseFromString(data)
+            kind = msg.WhichOneof('type')
+            if kind == 'delta' and msg.delta.WhichOneof('type') == 'new_element':
+                element = msg.delta.new_element
+                widget = getattr(element, element.WhichOneof('type'))
+                if getattr(widget, 'id', '') and getattr(widget, 'label', ''):
+                    self.widgets[widget.label] = widget
+            elif kind == 'script_finished' and msg.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                # A button handler's st.rerun() finishes early and starts a second run
+                return
+
+    async def type_text(self, label: str, value: str) -> float:
+        widget_id = self.widgets[label].id
+        self.states[widget_id] = WidgetState(id=widget_id, string_value=value)
+        return await self.rerun()
+
+    async def select(self, label: str, value: str) -> float:
+        widget = self.widgets[label]
+        if _SELECTBOX_SENDS_STRING:
+            state = WidgetState(id=widget.id, string_value=value)
+        else:
+            state = WidgetState(id=widget.id, int_value=list(widget.options).index(value))
+        self.states[widget.id] = state
+        return await self.rerun()
+
+    async def click(self, label: str) -> Optional[float]:
+        """Press a button if the last run rendered it"""
+        if label not in self.widgets:
+            return None
+        return await self.rerun(trigger=label)
+
+
+async def run_session(session: DashboardSession, rng: random.Random, actions: int, think: float,
+                      latencies: List[float], errors: List[str]):
+    """Initial page load followed by ``actions`` interactions"""
+    try:
+        latencies.append(await session.rerun())
+        for _ in range(actions):
+            action = rng.choices(['search', 'sort', 'visibility', 'paginate'], weights=[3, 1, 1, 4])[0]
+            if action == 'search':
+                term = rng.choice(SEARCH_TERMS)
+                # Model one rerun per keystroke, then clearing the box
+                for i in range(1, len(term) + 1):
+                    latencies.append(await session.type_text('Search', term[:i]))
+                latencies.append(await session.type_text('Search', ''))
+            elif action == 'sort':
+                latencies.append(await session.select('Sort By', rng.choice(SORT_OPTIONS)))
+            elif action == 'visibility':
+                latencies.append(await session.select('Visibility', rng.choice(PRIVACY_OPTIONS)))
+            else:
+                for _ in range(rng.randint(1, 3)):
+                    elapsed = await session.click('Next →')
+                    if elapsed is not None:
+                        latencies.append(elapsed)
+            if think:
+                await asyncio.sleep(rng.uniform(0, 2 * think))
+    except Exception as e:
+        errors.append(f"{type(e).__name__}: {e}")
+
+
+def rss_kb(pid: int) -> int:
+    """Resident set size of a process in kilobytes (Linux only)"""
+    with open(f'/proc/{pid}/status', encoding='utf-8') as status_file:
+        for line in status_file:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1])
+    return 0
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    position = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[position]
+
+
+class DashboardServer:
+    """``streamlit run app.py`` in a subprocess, pointed at the stub GitHub API"""
+
+    def __init__(self, api_url: str, port: int):
+        self.api_url = api_url
+        self.port = port
+        self.url = f"http://127.0.0.1:{port}"
+        self.process = None
+
+    def __enter__(self) -> 'DashboardServer':
+        self.process = subprocess.Popen(
+            [
+                sys.executable, '-m', 'streamlit', 'run', APP_PATH,
+                '--server.headless', 'true',
+                '--server.address', '127.0.0.1',
+                '--server.port', str(self.port),
+                '--browser.gatherUsageStats', 'false',
+            ],
+            cwd=ROOT_DIR,
+            env=dict(os.environ, GITHUB_API_URL=self.api_url),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        deadline = time.time() + 60
+        while time.time() < deadline:
+            try:
+                with urllib.request.urlopen(f"{self.url}/_stcore/health", timeout=1) as response:
+                    if response.status == 200:
+                        return self
+            except OSError:
+                time.sleep(0.2)
+        self.process.kill()
+        raise RuntimeError("Streamlit server did not become healthy within 60 seconds")
+
+    def __exit__(self, *exc_info):
+        self.process.terminate()
+        self.process.wait(timeout=30)
+
+
+async def warm_up(server: DashboardServer, timeout: float):
+    """Load the page once so imports, the first crawl and other one-time costs are paid up front"""
+    session = DashboardSession(server.url, timeout)
+    await session.connect()
+    try:
+        await session.rerun()
+    finally:
+        session.close()
+
+
+async def run_load(server: DashboardServer, sessions: int, actions: int, think: float,
+                   timeout: float, seed: int, sequential: bool = False) -> Dict:
+    """Run ``sessions`` action scripts at once, or one after another on a single session.
+
+    Script ``i`` always uses seed ``seed + i``, so both modes perform the same interactions.
+    """
+    await warm_up(server, timeout)
+    clients = [DashboardSession(server.url, timeout) for _ in range(1 if sequential else sessions)]
+    await asyncio.gather(*(client.connect() for client in clients))
+    rss_before = rss_kb(server.process.pid)
+
+    latencies: List[float] = []
+    errors: List[str] = []
+    start = time.perf_counter()
+    if sequential:
+        for i in range(sessions):
+            clients[0].states.clear()  # Each script starts from the default widget values, like a new viewer
+            await run_session(clients[0], random.Random(seed + i), actions, think, latencies, errors)
+    else:
+        await asyncio.gather(*(
+            run_session(client, random.Random(seed + i), actions, think, latencies, errors)
+            for i, client in enumerate(clients)
+        ))
+    elapsed = time.perf_counter() - start
+
+    # Measure while every session is still connected
+    rss_after = rss_kb(server.process.pid)
+    for client in clients:
+        client.close()
+
+    return {
+        'seconds': elapsed,
+        'latencies': latencies,
+        'errors': errors,
+        'rss_growth_kb': rss_after - rss_before,
+        'bytes_to_clients': sum(client.bytes_received for client in clients),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sessions', type=int, default=20, help="concurrent simulated viewers")
+    parser.add_argument('--actions', type=int, default=5, help="interactions per session after the first load")
+    parser.add_argument('--repos', type=int, default=200, help="catalog size served by the stub")
+    parser.add_argument('--latency', type=float, default=0.0, help="seconds added to every stub GitHub response")
+    parser.add_argument('--think', type=float, default=0.0, help="mean pause between a viewer's interactions")
+    parser.add_argument('--timeout', type=float, default=600, help="per-rerun timeout in seconds")
+    parser.add_argument('--port', type=int, default=8599, help="port for the Streamlit server under test")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="write JSON results to this file instead of stdout")
+    args = parser.parse_args()
+
+    with StubGitHub(ORG_NAME, args.repos, latency=args.latency) as stub:
+        # Baseline on a fresh server: the same scripts, one viewer at a time
+        with DashboardServer(stub.url, args.port) as server:
+            stub.reset_counters()
+            baseline = asyncio.run(run_load(
+                server, args.sessions, args.actions, 0.0, args.timeout, args.seed, sequential=True,
+            ))
+            baseline_calls = stub.counters()['requests']
+
+        with DashboardServer(stub.url, args.port) as server:
+            stub.reset_counters()
+            load = asyncio.run(run_load(server, args.sessions, args.actions, args.think, args.timeout, args.seed))
+            upstream_calls = stub.counters()['requests']
+
+    latencies = load['latencies']
+    results = {
+        'benchmark': 'load',
+        'sessions': args.sessions,
+        'actions_per_session': args.actions,
+        'repos': args.repos,
+        'latency_seconds': args.latency,
+        'think_seconds': args.think,
+        'wall_seconds': load['seconds'],
+        'reruns': len(latencies),
+        'throughput_reruns_per_second': len(latencies) / load['seconds'] if load['seconds'] else 0.0,
+        'rerun_latency_seconds': {
+            'mean': statistics.mean(latencies) if latencies else 0.0,
+            'p50': percentile(latencies, 50),
+            'p95': percentile(latencies, 95),
+            'p99': percentile(latencies, 99),
+            'max': max(latencies, default=0.0),
+        },
+        'upstream_calls': upstream_calls,
+        'upstream_calls_per_rerun': upstream_calls / len(latencies) if latencies else 0.0,
+        'single_session_upstream_calls': baseline_calls,
+        # 1.0 means N concurrent viewers cost GitHub no more than the same N viewers one after another
+        'upstream_amplification': upstream_calls / baseline_calls if baseline_calls else 0.0,
+        'server_rss_growth_kb_per_session': load['rss_growth_kb'] / args.sessions,
+        'bytes_to_clients_per_rerun': load['bytes_to_clients'] / len(latencies) if latencies else 0.0,
+        'errors': baseline['errors'] + load['errors'],
+    }
+
+    report = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            output_file.write(report + '\n')
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+from urllib.parse import parse_qs, urlencode, urlparse
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'fixtures', 'github')
+
+_ORG_REPOS_PATH = re.compile(r'^/orgs/(?P<org>[^/]+)/repos$')
+_README_PATH = re.compile(r'^/repos/(?P<org>[^/]+)/(?P<repo>[^/]+)/readme$')
+
+
+def load_fixture(name: str):
+    with open(os.path.join(FIXTURES_DIR, name), encoding='utf-8') as fixture_file:
+        return json.load(fixture_file)
+
+
+def build_catalog(org_name: str, size: int) -> List[Dict]:
+    """Scale the recorded organization listing up (or down) to ``size`` repositories"""
+    recorded = load_fixture('org_repos.json')
+    repos = []
+    for i in range(size):
+        repo = dict(recorded[i % len(recorded)])
+        name = f"{repo['name']}-{i}"
+        repo.update({
+            'id': 10_000_000 + i,
+            'name': name,
+            'full_name': f"{org_name}/{name}",
+            'html_url': f"https://github.com/{org_name}/{name}",
+        })
+        repos.append(repo)
+    return repos
+
+
+class StubGitHub:
+    """Local stand-in for the GitHub REST API that replays recorded responses.
+
+    Serves the organization listing (paginated like the real API, ``Link``
+    headers included) and README contents for a synthetic catalog of ``size``
+    repositories, sleeping ``latency`` seconds per request. Counts every
+    request and response byte so callers can measure upstream traffic.
+    """
+
+    def __init__(self, org_name: str, size: int, latency: float = 0.0, host: str = '127.0.0.1', port: int = 0):
+        self.org_name = org_name
+        self.latency = latency
+        self.repos = build_catalog(org_name, size)
+        self._names = {repo['name'] for repo in self.repos}
+        self._readme_body = json.dumps(load_fixture('readme.json')).encode('utf-8')
+        self._readme_etag = '"{}"'.format(hashlib.sha1(self._readme_body).hexdigest())
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.bytes_sent = 0
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'StubGitHub':
+        self._thread = threading.Thread(target=self._server.serve_forever, name='stub-github', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> 'StubGitHub':
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def reset_counters(self):
+        with self._lock:
+            self.requests = 0
+            self.bytes_sent = 0
+
+    def counters(self) -> Dict[str, int]:
+        with self._lock:
+            return {'requests': self.requests, 'bytes': self.bytes_sent}
+
+    def _record(self, body_size: int):
+        with self._lock:
+            self.requests += 1
+            self.bytes_sent += body_size
+
+    def _respond(self, path: str, query: Dict[str, List[str]], etag: str = None):
+        """Return (status, body, headers) for a request path"""
+        match = _ORG_REPOS_PATH.match(path)
+        if match and match.group('org') == self.org_name:
+            per_page = min(int(query.get('per_page', ['30'])[0]), 100)
+            page = int(query.get('page', ['1'])[0])
+            start = (page - 1) * per_page
+            return 200, json.dumps(self.repos[start:start + per_page]).encode('utf-8'), self._page_links(path, query, page, per_page)
+
+        match = _README_PATH.match(path)
+        if match and match.group('org') == self.org_name and match.group('repo') in self._names:
+            # Honour conditional requests like GitHub does
+            if etag == self._readme_etag:
+                return 304, b'', {'ETag': self._readme_etag}
+            return 200, self._readme_body, {'ETag': self._readme_etag}
+
+        return 404, b'{"message": "Not Found"}', {}
+
+    def _page_links(self, path: str, query: Dict[str, List[str]], page: int, per_page: int) -> Dict[str, str]:
+        """``Link`` header for a listing page; like GitHub, omitted when there is only one page"""
+        last = max(1, -(-len(self.repos) // per_page))
+        if last == 1:
+            return {}
+
+        def link(number: int, rel: str) -> str:
+            params = dict(query, page=[str(number)])
+            return f'<{self.url}{path}?{urlencode(params, doseq=True)}>; rel="{rel}"'
+
+        links = []
+        if page < last:
+            links += [link(page + 1, 'next'), link(last, 'last')]
+        if page > 1:
+            links += [link(page - 1, 'prev'), link(1, 'first')]
+        return {'Link': ', '.join(links)}
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if stub.latency:
+                    time.sleep(stub.latency)
+                parsed = urlparse(self.path)
+                status, body, headers = stub._respond(
+                    parsed.path, parse_qs(parsed.query), self.headers.get('If-None-Match')
+                )
+                stub._record(len(body))
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,51 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+from metrics import get_metrics
+
+# Rendered cards kept per process; 0 disables the cache
+CARD_CACHE_SIZE = int(os.getenv("CARD_CACHE_SIZE", "4096"))
+
+
+class CardCache:
+    """Bounded LRU of rendered card HTML shared by every session"""
+
+    def __init__(self, maxsize: int = CARD_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries: 'OrderedDict[Hashable, str]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[str]:
+        metrics = get_metrics()
+        with self._lock:
+            html = self._entries.get(key)
+            if html is not None:
+                self._entries.move_to_end(key)
+        metrics.inc('cache_hits_total' if html is not None else 'cache_misses_total', cache='card')
+        return html
+
+    def put(self, key: Hashable, html: str):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = html
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_cache = CardCache()
+
+
+def get_card_cache() -> CardCache:
+    """The card cache shared by this process"""
+    return _cache
@@ -0,0 +1,240 @@
+import threading
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from facets import FacetIndex
+from metrics import get_metrics
+
+# How long a fetched catalog is served before the organization is crawled again
+CATALOG_TTL_SECONDS = 300
+
+ReadmeInfo = Tuple[Optional[str], Optional[str]]
+
+# Called with (repo_name, etag); returns (info, etag) with info None when not modified,
+# or None when the fetch failed and nothing should be cached
+ReadmeLoader = Callable[[str, Optional[str]], Optional[Tuple[Optional[ReadmeInfo], Optional[str]]]]
+# Called with a list of (repo_name, etag); returns one ReadmeLoader result per entry, in order
+ReadmeBatchLoader = Callable[[List[Tuple[str, Optional[str]]]], List[Optional[Tuple[Optional[ReadmeInfo], Optional[str]]]]]
+
+
+class ReadmeEntry(NamedTuple):
+    info: ReadmeInfo
+    etag: Optional[str]
+    fetched_at: float
+
+
+class CatalogSnapshot:
+    """An immutable view of the organization's repositories"""
+
+    def __init__(self, version: int, repos: Sequence[Dict], loaded_at: float,
+                 readme: Optional[Dict[str, ReadmeInfo]] = None):
+        self.version = version
+        # A list of dicts, or a column-backed view of a mapped snapshot
+        self.repos = repos
+        self.loaded_at = loaded_at
+        # README metadata published alongside the repositories, if any (looked up with ``get``)
+        self.readme = readme
+        self._index: Optional[FacetIndex] = None
+        self._index_lock = threading.Lock()
+
+    @property
+    def index(self) -> FacetIndex:
+        """Facet bitmaps for this snapshot, built once on first use"""
+        if self._index is None:
+            with self._index_lock:
+                if self._index is None:
+                    self._index = FacetIndex(self.repos)
+        return self._index
+
+
+class CatalogStore:
+    """Process-wide catalog shared by every Streamlit session"""
+
+    def __init__(self, ttl: float = CATALOG_TTL_SECONDS):
+        self.ttl = ttl
+        self._lock = threading.RLock()
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._version = 0
+        # README metadata per repository name
+        self._readme: Dict[str, ReadmeEntry] = {}
+        self._readme_versions: Dict[str, int] = {}
+        # Set when this process serves a snapshot published by the refresher
+        self._reader = None
+
+    def clear(self):
+        """Forget the catalog and all README metadata so the next request crawls again"""
+        with self._lock:
+            self._snapshot = None
+            self._readme.clear()
+
+    def attach_snapshot(self, path: str):
+        """Serve the catalog from the snapshot file at ``path`` instead of crawling GitHub"""
+        # pyarrow is only needed by workers reading a published snapshot
+        from snapshot import SnapshotReader
+
+        with self._lock:
+            if self._reader is None or self._reader.path != path:
+                self._reader = SnapshotReader(path)
+
+    def is_stale(self) -> bool:
+        snapshot = self._snapshot
+        return snapshot is None or time.time() - snapshot.loaded_at > self.ttl
+
+    def get(self, loader: Callable[[], Optional[List[Dict]]]) -> CatalogSnapshot:
+        """Return the current snapshot, calling ``loader`` when it is missing or stale.
+
+        Concurrent sessions wait on the same crawl instead of each starting
+        their own. When the loader fails (``None``) or finds nothing, the
+        previous snapshot is kept, still stale, so the crawl is retried on
+        the next rerun.
+        """
+        metrics = get_metrics()
+        if self._reader is not None:
+            return self._mapped_snapshot()
+        if not self.is_stale():
+            metrics.inc('cache_hits_total', cache='catalog')
+            return self._snapshot
+        with self._lock:
+            if not self.is_stale():
+                metrics.inc('cache_hits_total', cache='catalog')
+                return self._snapshot
+            metrics.inc('cache_misses_total', cache='catalog')
+            repos = loader()
+            if not repos:
+                return self._snapshot or CatalogSnapshot(self._version, [], time.time())
+            return self.replace(repos)
+
+    def _mapped_snapshot(self) -> CatalogSnapshot:
+        """The refresher's latest snapshot; workers never call GitHub themselves"""
+        mapped = self._reader.current()
+        if mapped is None:
+            return CatalogSnapshot(self._version, [], time.time())
+        if self._snapshot is not mapped:
+            with self._lock:
+                self._snapshot = mapped
+            metrics = get_metrics()
+            metrics.inc('catalog_snapshot_loads_total')
+            metrics.set_gauge('catalog_snapshot_version', mapped.version)
+        return mapped
+
+    def replace(self, repos: List[Dict]) -> CatalogSnapshot:
+        """Publish a freshly crawled list of repositories"""
+        with self._lock:
+            return self._publish(list(repos), time.time())
+
+    def _publish(self, repos: List[Dict], loaded_at: float) -> CatalogSnapshot:
+        self._version += 1
+        self._snapshot = CatalogSnapshot(self._version, repos, loaded_at)
+        return self._snapshot
+
+    def upsert(self, repo: Dict) -> bool:
+        """Insert or replace a single repository without re-crawling.
+
+        Entries are matched by id so renames replace the old row. Returns
+        ``False`` when there is no catalog loaded yet; the next crawl will
+        pick the repository up anyway.
+        """
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is None:
+                return False
+            repos = [
+                existing for existing in snapshot.repos
+                if existing.get('id') != repo.get('id') and existing.get('name') != repo.get('name')
+            ]
+            # Most recently updated first, matching the order of the crawl
+            repos.insert(0, repo)
+            self._publish(repos, snapshot.loaded_at)
+            return True
+
+    def remove(self, repo_name: str) -> bool:
+        """Drop a repository (deleted upstream) from the catalog"""
+        with self._lock:
+            self.invalidate_readme(repo_name)
+            snapshot = self._snapshot
+            if snapshot is None:
+                return False
+            repos = [repo for repo in snapshot.repos if repo.get('name') != repo_name]
+            if len(repos) == len(snapshot.repos):
+                return False
+            self._publish(repos, snapshot.loaded_at)
+            return True
+
+    def readme_version(self, repo_name: str) -> int:
+        """Counter bumped every time a repository's README metadata is invalidated or changes"""
+        snapshot = self._snapshot
+        if self._reader is not None:
+            # A worker's README metadata only changes with a new published snapshot
+            return snapshot.version if snapshot else 0
+        return self._readme_versions.get(repo_name, 0)
+
+    def readme_is_fresh(self, repo_name: str) -> bool:
+        """Whether README metadata is cached and within its TTL"""
+        if self._reader is not None:
+            return True
+        cached = self._readme.get(repo_name)
+        return cached is not None and time.time() - cached.fetched_at <= self.ttl
+
+    def readme_info(self, repo_name: str, loader: ReadmeLoader) -> ReadmeInfo:
+        """Cached README metadata for a repository.
+
+        On a miss the loader fetches it; after the TTL the loader is given the
+        previous ETag so an unchanged README costs a 304 instead of a download.
+        """
+        batch_loader = lambda lookups: [loader(name, etag) for name, etag in lookups]
+        return self.readme_infos([repo_name], batch_loader)[repo_name]
+
+    def readme_infos(self, repo_names: List[str], loader: ReadmeBatchLoader) -> Dict[str, ReadmeInfo]:
+        """Cached README metadata for several repositories, loading every miss in one call"""
+        snapshot = self._snapshot
+        if self._reader is not None:
+            readme = (snapshot.readme if snapshot else None) or {}
+            return {name: readme.get(name, (None, None)) for name in repo_names}
+
+        metrics = get_metrics()
+        infos: Dict[str, ReadmeInfo] = {}
+        misses = []
+        for name in dict.fromkeys(repo_names):
+            cached = self._readme.get(name)
+            if cached is not None and time.time() - cached.fetched_at <= self.ttl:
+                metrics.inc('cache_hits_total', cache='readme')
+                infos[name] = cached.info
+            else:
+                metrics.inc('cache_misses_total', cache='readme')
+                misses.append((name, cached, self.readme_version(name)))
+        if not misses:
+            return infos
+
+        loaded = loader([(name, cached.etag if cached else None) for name, cached, _ in misses])
+        with self._lock:
+            for (name, cached, version), result in zip(misses, loaded):
+                if result is None:
+                    # Failed fetch: serve what we had, but leave the entry expired so it is retried
+                    infos[name] = cached.info if cached else (None, None)
+                    continue
+                info, etag = result
+                if info is None:
+                    # Not modified: keep the parsed metadata and restart its TTL
+                    info = cached.info if cached else (None, None)
+                # Don't store a result that an invalidation raced past
+                if self.readme_version(name) == version:
+                    self._readme[name] = ReadmeEntry(info, etag, time.time())
+                    if cached is not None and info != cached.info:
+                        # Revalidation found new metadata; anything derived from the old one is stale
+                        self._readme_versions[name] = version + 1
+                infos[name] = info
+        return infos
+
+    def invalidate_readme(self, repo_name: str):
+        """Forget a repository's README metadata so the next render refetches it"""
+        with self._lock:
+            self._readme.pop(repo_name, None)
+            self._readme_versions[repo_name] = self.readme_version(repo_name) + 1
+
+
+_store = CatalogStore()
+
+
+def get_catalog_store() -> CatalogStore:
+    """The catalog store shared by this process"""
+    return _store
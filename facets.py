@@ -0,0 +1,269 @@
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Facet choices offered in the filter bar
+SORT_OPTIONS = ["Latest", "Oldest", "A-Z", "Z-A"]
+PRIVACY_OPTIONS = ["All", "Public Only", "Private Only"]
+ARCHIVED_OPTIONS = ["Include Archived", "Hide Archived", "Archived Only"]
+ACTIVITY_WINDOWS = [7, 30, 90, 180, 365]  # days
+SEARCH_CACHE_SIZE = 256
+
+# Repository fields the index reads, with the value assumed when a row lacks one
+FACET_FIELDS = {
+    'name': '',
+    'description': None,
+    'fork': True,
+    'private': False,
+    'archived': False,
+    'language': None,
+    'topics': None,
+    'pushed_at': None,
+    'stargazers_count': None,
+    'updated_at': '',
+}
+
+
+@dataclass
+class FacetFilters:
+    """Facet selections made in the filter bar"""
+    languages: List[str] = field(default_factory=list)
+    topics: List[str] = field(default_factory=list)
+    archived: str = "Include Archived"
+    stars: Optional[Tuple[int, int]] = None
+    active_within: Optional[int] = None
+
+    def key(self) -> str:
+        """Stable string used to detect filter changes between reruns"""
+        return f"{sorted(self.languages)}_{sorted(self.topics)}_{self.archived}_{self.stars}_{self.active_within}"
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse a GitHub ISO-8601 timestamp"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+
+class FacetIndex:
+    """Per-value bitsets over one catalog snapshot.
+
+    Row ``i`` of the snapshot is bit ``i`` of every bitmap, so a combination
+    of facets is a handful of integer ``&`` operations and a count is
+    ``int.bit_count()``. The index is immutable; build a new one whenever
+    the catalog changes.
+    """
+
+    def __init__(self, repos: Sequence[Dict], now: Optional[datetime] = None):
+        self.repos = repos
+        self.size = len(repos)
+        self.all = (1 << self.size) - 1
+        now = now or datetime.now(timezone.utc)
+
+        # Column-backed catalogs (a mapped snapshot) hand over whole columns, so no row dicts are built
+        if hasattr(repos, 'columns'):
+            columns = repos.columns(list(FACET_FIELDS))
+        else:
+            columns = {name: [repo.get(name, default) for repo in repos] for name, default in FACET_FIELDS.items()}
+
+        self.visible = 0
+        self.private = 0
+        self.archived = 0
+        self.languages: Dict[str, int] = {}
+        self.topics: Dict[str, int] = {}
+        self.active_within: Dict[int, int] = {days: 0 for days in ACTIVITY_WINDOWS}
+        # Column-backed catalogs search their own columns instead of a copy of every name and description
+        self._haystacks: Optional[List[str]] = None if hasattr(repos, 'matching_rows') else []
+        stars: List[int] = []
+
+        for i in range(self.size):
+            bit = 1 << i
+            description = columns['description'][i]
+            # Forks are only listed when they carry a description
+            if description or not columns['fork'][i]:
+                self.visible |= bit
+            if columns['private'][i]:
+                self.private |= bit
+            if columns['archived'][i]:
+                self.archived |= bit
+
+            language = columns['language'][i]
+            if language:
+                self.languages[language] = self.languages.get(language, 0) | bit
+            for topic in columns['topics'][i] or []:
+                self.topics[topic] = self.topics.get(topic, 0) | bit
+
+            pushed_at = _parse_timestamp(columns['pushed_at'][i])
+            if pushed_at is not None:
+                age_days = (now - pushed_at).total_seconds() / 86400
+                for days in ACTIVITY_WINDOWS:
+                    if age_days <= days:
+                        self.active_within[days] |= bit
+
+            stars.append(int(columns['stargazers_count'][i] or 0))
+
+            if self._haystacks is not None:
+                name = (columns['name'][i] or '').lower()
+                if isinstance(description, str):
+                    self._haystacks.append(f"{name}\n{description.lower()}")
+                else:
+                    self._haystacks.append(name)
+
+        self.public = self.all & ~self.private
+
+        # Cumulative "at least N stars" bitmaps, one per distinct star count
+        self.star_values = sorted(set(stars))
+        self._stars_at_least: List[int] = [0] * (len(self.star_values) + 1)
+        by_value: Dict[int, int] = {}
+        for i, count in enumerate(stars):
+            by_value[count] = by_value.get(count, 0) | (1 << i)
+        for pos in range(len(self.star_values) - 1, -1, -1):
+            self._stars_at_least[pos] = self._stars_at_least[pos + 1] | by_value[self.star_values[pos]]
+
+        # Precomputed row orders for every sort option. Descending orders are sorted with
+        # reverse=True rather than reversed, so ties keep crawl order like the ascending ones
+        updated_at = [value or '' for value in columns['updated_at']].__getitem__
+        name = [(value or '').lower() for value in columns['name']].__getitem__
+        # Kept as compact arrays; lists of ints would cost about 40 bytes per row per order
+        self._orders: Dict[str, array] = {
+            "Latest": array('i', sorted(range(self.size), key=updated_at, reverse=True)),
+            "Oldest": array('i', sorted(range(self.size), key=updated_at)),
+            "A-Z": array('i', sorted(range(self.size), key=name)),
+            "Z-A": array('i', sorted(range(self.size), key=name, reverse=True)),
+        }
+
+        # Shared by every session thread searching this snapshot
+        self._search_cache: "OrderedDict[str, int]" = OrderedDict()
+        self._search_lock = threading.Lock()
+
+    @property
+    def max_stars(self) -> int:
+        return self.star_values[-1] if self.star_values else 0
+
+    def search(self, query: str) -> int:
+        """Bitmap of rows whose name or description contains the query"""
+        query = query.lower()
+        if not query:
+            return self.all
+        with self._search_lock:
+            bitmap = self._search_cache.get(query)
+            if bitmap is not None:
+                self._search_cache.move_to_end(query)
+                return bitmap
+
+        bitmap = 0
+        if self._haystacks is None:
+            for i in self.repos.matching_rows(query):
+                bitmap |= 1 << i
+        else:
+            for i, haystack in enumerate(self._haystacks):
+                if query in haystack:
+                    bitmap |= 1 << i
+        with self._search_lock:
+            self._search_cache[query] = bitmap
+            if len(self._search_cache) > SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+        return bitmap
+
+    def stars_between(self, low: int, high: int) -> int:
+        """Bitmap of rows with ``low <= stargazers_count <= high``"""
+        start = bisect_left(self.star_values, low)
+        stop = bisect_right(self.star_values, high)
+        return self._stars_at_least[start] & ~self._stars_at_least[stop]
+
+    def _union(self, bitmaps: Dict[str, int], values: Iterable[str]) -> int:
+        result = 0
+        for value in values:
+            result |= bitmaps.get(value, 0)
+        return result
+
+    def match(self, privacy_filter: str, search_query: str, filters: FacetFilters, exclude: Optional[str] = None) -> int:
+        """Intersect every active filter into one bitmap.
+
+        ``exclude`` names a facet to leave out, which is how per-value counts
+        for that facet are computed (selecting a language should not hide
+        the other languages' counts).
+        """
+        bitmap = self.visible
+
+        if privacy_filter == "Public Only":
+            bitmap &= self.public
+        elif privacy_filter == "Private Only":
+            bitmap &= self.private
+
+        if search_query:
+            bitmap &= self.search(search_query)
+
+        if filters.languages and exclude != 'language':
+            bitmap &= self._union(self.languages, filters.languages)
+        if filters.topics and exclude != 'topic':
+            bitmap &= self._union(self.topics, filters.topics)
+
+        if exclude != 'archived':
+            if filters.archived == "Hide Archived":
+                bitmap &= ~self.archived
+            elif filters.archived == "Archived Only":
+                bitmap &= self.archived
+
+        if filters.stars is not None:
+            bitmap &= self.stars_between(*filters.stars)
+
+        if filters.active_within and exclude != 'activity':
+            bitmap &= self.active_within.get(filters.active_within, self.all)
+
+        return bitmap
+
+    def facet_counts(self, privacy_filter: str, search_query: str, filters: FacetFilters) -> Dict[str, Dict]:
+        """Number of matching repositories for every value of every facet"""
+        language_mask = self.match(privacy_filter, search_query, filters, exclude='language')
+        topic_mask = self.match(privacy_filter, search_query, filters, exclude='topic')
+        archived_mask = self.match(privacy_filter, search_query, filters, exclude='archived')
+        activity_mask = self.match(privacy_filter, search_query, filters, exclude='activity')
+
+        return {
+            'language': {value: (bits & language_mask).bit_count() for value, bits in self.languages.items()},
+            'topic': {value: (bits & topic_mask).bit_count() for value, bits in self.topics.items()},
+            'archived': {
+                "Include Archived": archived_mask.bit_count(),
+                "Hide Archived": (archived_mask & ~self.archived).bit_count(),
+                "Archived Only": (archived_mask & self.archived).bit_count(),
+            },
+            'activity': {days: (bits & activity_mask).bit_count() for days, bits in self.active_within.items()},
+        }
+
+    def select(self, bitmap: int, sort_option: str) -> 'RowSelection':
+        """The rows of a bitmap in the requested sort order"""
+        if not bitmap:
+            return RowSelection(self.repos, [])
+        bits = bitmap.to_bytes((self.size + 7) // 8, 'little')
+        order = self._orders.get(sort_option, range(self.size))
+        return RowSelection(self.repos, [i for i in order if bits[i >> 3] >> (i & 7) & 1])
+
+
+class RowSelection(Sequence[Dict]):
+    """Selected catalog rows in display order.
+
+    Rows are only read from the catalog when indexed or sliced, so a
+    column-backed catalog turns just the page or window on screen into dicts.
+    """
+
+    def __init__(self, repos: Sequence[Dict], rows: List[int]):
+        self._repos = repos
+        self._rows = rows
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            rows = self._rows[index]
+            take = getattr(self._repos, 'take', None)
+            return take(rows) if take is not None else [self._repos[i] for i in rows]
+        return self._repos[self._rows[index]]
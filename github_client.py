@@ -0,0 +1,213 @@
+import asyncio
+import concurrent.futures
+import json
+import os
+import re
+import threading
+from typing import Any, Awaitable, Dict, List, Optional, Set, TypeVar
+from urllib.parse import parse_qs, urlparse
+
+from tornado.httpclient import AsyncHTTPClient, HTTPClientError, HTTPRequest
+from tornado.httputil import HTTPHeaders, url_concat
+
+# Requests in flight at once across every session in the process
+GITHUB_MAX_CONCURRENCY = int(os.getenv("GITHUB_MAX_CONCURRENCY", "64"))
+GITHUB_TIMEOUT_SECONDS = float(os.getenv("GITHUB_TIMEOUT_SECONDS", "30"))
+# How often a blocked script thread checks whether its session still wants the result
+CANCEL_POLL_SECONDS = 0.1
+
+_LAST_PAGE_LINK = re.compile(r'<([^>]+)>;\s*rel="last"')
+
+T = TypeVar('T')
+
+
+class GitHubRequestError(Exception):
+    """A request that never got an HTTP response (connection error, timeout)"""
+
+
+class GitHubRequestCancelled(Exception):
+    """The session waiting for a request went away, so the request was cancelled"""
+
+
+class GitHubResponse:
+    """Status, headers and body of a GitHub API response"""
+
+    def __init__(self, status_code: int, headers: HTTPHeaders, body: bytes):
+        self.status_code = status_code
+        self.headers = headers
+        self.body = body
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+def _last_page(link_header: Optional[str]) -> Optional[int]:
+    """Page number of the ``rel="last"`` link in a ``Link`` header"""
+    match = _LAST_PAGE_LINK.search(link_header or '')
+    if not match:
+        return None
+    pages = parse_qs(urlparse(match.group(1)).query).get('page')
+    return int(pages[0]) if pages and pages[0].isdigit() else None
+
+
+def _run_abandoned(ctx) -> bool:
+    """Whether the Streamlit run behind ``ctx`` no longer needs what it is waiting for.
+
+    True once the session has disconnected or has asked for a rerun or stop
+    (for example by changing a filter mid-load).
+    """
+    from streamlit.runtime import Runtime
+
+    if Runtime.exists() and not Runtime.instance().is_active_session(ctx.session_id):
+        return True
+    # Streamlit has no public way to see a pending rerun or stop before the script's next
+    # st call, so peek at ScriptRequests (checked against Streamlit 1.42.2 and 1.66). If
+    # that attribute goes away, only disconnects cancel requests.
+    state = getattr(getattr(ctx, 'script_requests', None), '_state', None)
+    return getattr(state, 'name', 'CONTINUE') in ('RERUN', 'STOP')
+
+
+class GitHubClient:
+    """Asyncio GitHub API client running on its own event-loop thread.
+
+    Every session shares one loop and one cap on requests in flight. The
+    coroutine methods (``get``, ``get_pages``) run on that loop; ``run`` and
+    the ``fetch*`` methods are the synchronous facade for Streamlit's script
+    threads and other blocking callers.
+    """
+
+    def __init__(self, max_concurrency: int = GITHUB_MAX_CONCURRENCY, timeout: float = GITHUB_TIMEOUT_SECONDS):
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._http: Optional[AsyncHTTPClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        # Futures each session is waiting on, so they can be cancelled together
+        self._session_futures: Dict[str, Set[concurrent.futures.Future]] = {}
+        self._futures_lock = threading.Lock()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            with self._start_lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+                    self._thread = threading.Thread(target=loop.run_forever, name='github-client', daemon=True)
+                    self._thread.start()
+                    asyncio.run_coroutine_threadsafe(self._setup(), loop).result()
+                    self._loop = loop
+        return self._loop
+
+    async def _setup(self):
+        # Both bind to the running loop, so they are created on it
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._http = AsyncHTTPClient(force_instance=True, max_clients=self.max_concurrency)
+
+    async def get(self, url: str, headers: Dict[str, str], params: Optional[Dict] = None) -> GitHubResponse:
+        """GET a URL, waiting for a free slot under the concurrency cap"""
+        request = HTTPRequest(
+            url_concat(url, params) if params else url,
+            headers=headers,
+            connect_timeout=self.timeout,
+            request_timeout=self.timeout,
+        )
+        async with self._semaphore:
+            try:
+                response = await self._http.fetch(request, raise_error=False)
+            except (HTTPClientError, OSError) as e:
+                raise GitHubRequestError(f"GET {url} failed: {e}") from e
+        if response.code == 599:
+            # Tornado reports timeouts and dropped connections as a synthetic 599
+            raise GitHubRequestError(f"GET {url} failed: {response.error}")
+        return GitHubResponse(response.code, response.headers, response.body or b'')
+
+    async def get_pages(self, url: str, headers: Dict[str, str], params: Dict) -> List[GitHubResponse]:
+        """Every page of a paginated listing, in order, ending at the first failed page.
+
+        The first page's ``Link`` header says how many pages there are, so the
+        rest are requested concurrently. Without one, pages are walked until
+        an empty one comes back.
+        """
+        first = await self.get(url, headers, dict(params, page=1))
+        if first.status_code != 200:
+            return [first]
+
+        responses = [first]
+        last_page = _last_page(first.headers.get('Link'))
+        if last_page is not None:
+            rest = await asyncio.gather(*(
+                self.get(url, headers, dict(params, page=page)) for page in range(2, last_page + 1)
+            ))
+            for response in rest:
+                responses.append(response)
+                if response.status_code != 200:
+                    break
+            return responses
+
+        while responses[-1].status_code == 200 and responses[-1].json():
+            responses.append(await self.get(url, headers, dict(params, page=len(responses) + 1)))
+        return responses
+
+    def run(self, coro: Awaitable[T], cancellable: bool = True) -> T:
+        """Run a coroutine on the client's loop and block until it finishes.
+
+        Called from a Streamlit script thread with ``cancellable`` set, the
+        wait ends early once the session reruns, stops or disconnects: the
+        session's outstanding requests are cancelled and
+        ``GitHubRequestCancelled`` is raised. Script code catches it and
+        returns without further output, so Streamlit handles the pending
+        rerun or stop as usual.
+        """
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("GitHubClient.run() would deadlock on the client's own loop; await instead")
+
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+        ctx = get_script_run_ctx(suppress_warning=True) if cancellable else None
+        if ctx is None:
+            return future.result()
+
+        with self._futures_lock:
+            self._session_futures.setdefault(ctx.session_id, set()).add(future)
+        try:
+            while True:
+                done, _ = concurrent.futures.wait([future], timeout=CANCEL_POLL_SECONDS)
+                if done:
+                    return future.result()
+                if _run_abandoned(ctx):
+                    self.cancel_session(ctx.session_id)
+                    raise GitHubRequestCancelled(f"Session {ctx.session_id} no longer needs this request")
+        finally:
+            with self._futures_lock:
+                futures = self._session_futures.get(ctx.session_id)
+                if futures is not None:
+                    futures.discard(future)
+                    if not futures:
+                        del self._session_futures[ctx.session_id]
+
+    def cancel_session(self, session_id: str) -> int:
+        """Cancel every request a session is waiting on; returns how many were cancelled"""
+        with self._futures_lock:
+            futures = list(self._session_futures.get(session_id, ()))
+        return sum(future.cancel() for future in futures)
+
+    def fetch(self, url: str, headers: Dict[str, str], params: Optional[Dict] = None,
+              cancellable: bool = True) -> GitHubResponse:
+        """Synchronous ``get``"""
+        return self.run(self.get(url, headers, params), cancellable)
+
+    def fetch_pages(self, url: str, headers: Dict[str, str], params: Dict,
+                    cancellable: bool = True) -> List[GitHubResponse]:
+        """Synchronous ``get_pages``"""
+        return self.run(self.get_pages(url, headers, params), cancellable)
+
+
+_client = GitHubClient()
+
+
+def get_github_client() -> GitHubClient:
+    """The GitHub client shared by this process"""
+    return _client
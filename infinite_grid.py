@@ -0,0 +1,53 @@
+import os
+from typing import List
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+FRONTEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'frontend', 'infinite_grid')
+
+WINDOW_SIZE = 48  # Cards sent per request; 1,000 repositories take 21 windows
+GRID_HEIGHT = 760  # Pixels; a little over two rows of cards
+ROW_HEIGHT = 350  # .repo-card height plus its vertical margins
+
+_component = None
+
+
+def _get_component():
+    """Declare the component on first use; declaring it costs tens of milliseconds at import"""
+    global _component
+    if _component is None:
+        _component = components.declare_component('infinite_grid', path=FRONTEND_DIR)
+    return _component
+
+
+def requested_window(key: str, filter_key: str, total: int) -> int:
+    """Start of the window the grid last asked for, or 0 once the filters change"""
+    request = st.session_state.get(key) or {}
+    if request.get('filter_key') != filter_key:
+        return 0
+    start = int(request.get('start', 0)) // WINDOW_SIZE * WINDOW_SIZE
+    return min(max(start, 0), max(total - 1, 0) // WINDOW_SIZE * WINDOW_SIZE)
+
+
+def infinite_grid(cards: List[str], start: int, total: int, filter_key: str, css: str,
+                  columns: int, key: str):
+    """Render one window of card HTML into the virtualized grid.
+
+    The browser keeps every window it has received for the current
+    ``filter_key`` and asks for the next one (through the component value)
+    only when the reader scrolls close to the end of what it has.
+    """
+    return _get_component()(
+        cards=cards,
+        start=start,
+        total=total,
+        filter_key=filter_key,
+        css=css,
+        columns=columns,
+        row_height=ROW_HEIGHT,
+        window_size=WINDOW_SIZE,
+        height=GRID_HEIGHT,
+        key=key,
+        default=None,
+    )
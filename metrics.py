@@ -0,0 +1,212 @@
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Optional, Tuple
+
+METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+SPAN_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+METRIC_HELP = {
+    'dashboard_span_seconds': ('histogram', "Time spent in instrumented sections of the dashboard"),
+    'github_api_requests_total': ('counter', "GitHub API requests by endpoint and status code"),
+    'github_not_modified_total': ('counter', "GitHub API responses answered with 304 Not Modified"),
+    'github_rate_limit_remaining': ('gauge', "Requests left in the current GitHub rate-limit window"),
+    'cache_hits_total': ('counter', "Lookups served from the shared catalog caches"),
+    'cache_misses_total': ('counter', "Lookups that had to go to GitHub"),
+    'catalog_snapshot_loads_total': ('counter', "Times a worker mapped a newly published catalog snapshot"),
+    'catalog_snapshot_version': ('gauge', "Version of the catalog snapshot this worker is serving"),
+    'readme_errors_total': ('counter', "README fetches that failed to download or parse"),
+}
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+logger = logging.getLogger(__name__)
+
+
+def _label_key(labels: Dict[str, str]) -> LabelKey:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _format_labels(labels: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ''
+    escaped = [
+        '{}="{}"'.format(key, value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for key, value in pairs
+    ]
+    return '{' + ','.join(escaped) + '}'
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class Histogram:
+    """Cumulative bucket counts plus sum and count for one label set"""
+
+    def __init__(self, buckets: Tuple[float, ...] = SPAN_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Metrics:
+    """Process-wide counters, gauges and timing histograms"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._gauges: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+
+    def inc(self, name: str, amount: float = 1.0, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + amount
+
+    def set_gauge(self, name: str, value: float, **labels):
+        with self._lock:
+            self._gauges.setdefault(name, {})[_label_key(labels)] = value
+
+    def observe(self, name: str, value: float, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            if key not in series:
+                series[key] = Histogram()
+            series[key].observe(value)
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Time a block of code into ``dashboard_span_seconds{span=name}``"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe('dashboard_span_seconds', time.perf_counter() - start, span=name)
+
+    def record_github_response(self, endpoint: str, response):
+        """Count a GitHub API response and track the remaining rate limit"""
+        self.inc('github_api_requests_total', endpoint=endpoint, status=response.status_code)
+        if response.status_code == 304:
+            self.inc('github_not_modified_total', endpoint=endpoint)
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        if remaining is not None and remaining.isdigit():
+            self.set_gauge('github_rate_limit_remaining', int(remaining))
+
+    def counter_total(self, name: str, **labels) -> float:
+        """Sum of a counter across every series matching ``labels``"""
+        wanted = set(_label_key(labels))
+        with self._lock:
+            return sum(
+                value for key, value in self._counters.get(name, {}).items()
+                if wanted <= set(key)
+            )
+
+    def span_summary(self) -> List[Dict]:
+        """Count, total and mean time per span, for the in-app debug panel"""
+        with self._lock:
+            series = self._histograms.get('dashboard_span_seconds', {})
+            rows = [
+                {
+                    'span': dict(key).get('span', ''),
+                    'count': histogram.count,
+                    'total_ms': round(histogram.sum * 1000, 2),
+                    'mean_ms': round(histogram.sum / histogram.count * 1000, 3) if histogram.count else 0.0,
+                }
+                for key, histogram in series.items()
+            ]
+        return sorted(rows, key=lambda row: row['total_ms'], reverse=True)
+
+    def render_prometheus(self) -> str:
+        """All metrics in the Prometheus text exposition format"""
+        lines = []
+        with self._lock:
+            for kind, store in (('counter', self._counters), ('gauge', self._gauges)):
+                for name in sorted(store):
+                    self._header(lines, name, kind)
+                    for key, value in sorted(store[name].items()):
+                        lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+
+            for name in sorted(self._histograms):
+                self._header(lines, name, 'histogram')
+                for key, histogram in sorted(self._histograms[name].items()):
+                    cumulative = 0
+                    for bound, count in zip(histogram.buckets, histogram.counts):
+                        cumulative += count
+                        lines.append(f"{name}_bucket{_format_labels(key, ('le', repr(bound)))} {cumulative}")
+                    lines.append(f"{name}_bucket{_format_labels(key, ('le', '+Inf'))} {histogram.count}")
+                    lines.append(f"{name}_sum{_format_labels(key)} {repr(histogram.sum)}")
+                    lines.append(f"{name}_count{_format_labels(key)} {histogram.count}")
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def _header(lines: List[str], name: str, kind: str):
+        kind, description = METRIC_HELP.get(name, (kind, name))
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} {kind}")
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    """Serves ``/metrics`` for Prometheus to scrape"""
+
+    metrics: Metrics = None
+
+    def do_GET(self):
+        if self.path.split('?')[0] != '/metrics':
+            self.send_error(404)
+            return
+        body = self.metrics.render_prometheus().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Keep scrapes out of the Streamlit console
+
+
+_metrics = Metrics()
+_server: Optional[ThreadingHTTPServer] = None
+# Set when binding failed, so reruns don't retry (and log) on every interaction
+_server_error: Optional[OSError] = None
+_server_lock = threading.Lock()
+
+
+def get_metrics() -> Metrics:
+    """The metrics registry shared by this process"""
+    return _metrics
+
+
+def start_metrics_server(port: int, host: str = METRICS_HOST) -> Optional[ThreadingHTTPServer]:
+    """Expose ``/metrics`` on a daemon thread, once per process.
+
+    Returns ``None`` if the port could not be bound; the failure is logged
+    once and the dashboard keeps running without the endpoint.
+    """
+    global _server, _server_error
+    with _server_lock:
+        if _server is None and _server_error is None:
+            handler = type('BoundMetricsHandler', (MetricsHandler,), {'metrics': _metrics})
+            try:
+                _server = ThreadingHTTPServer((host, port), handler)
+            except OSError as e:
+                # Typically another process on the host already serves this port
+                _server_error = e
+                logger.warning("Metrics endpoint disabled: cannot bind %s:%s (%s)", host, port, e)
+                return None
+            threading.Thread(target=_server.serve_forever, name='metrics-server', daemon=True).start()
+        return _server
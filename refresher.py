@@ -0,0 +1,92 @@
+"""Publish the organization catalog as a memory-mapped snapshot for dashboard workers.
+
+Run one refresher per host and start every Streamlit worker with the same
+``CATALOG_SNAPSHOT_PATH``. The refresher is the only process that talks to
+GitHub: it crawls the organization when the catalog goes stale, revalidates
+README metadata, applies webhooks, and republishes the snapshot whenever
+anything changed::
+
+    CATALOG_SNAPSHOT_PATH=/var/lib/atlworks/catalog.arrow python refresher.py
+"""
+import argparse
+import logging
+import os
+import time
+from typing import Dict, Optional, Tuple
+
+from app import ORG_NAME, GitHubProjectsDashboard
+from catalog import CATALOG_TTL_SECONDS, CatalogStore, ReadmeInfo
+from github_client import GitHubRequestError
+from metrics import start_metrics_server
+from snapshot import write_snapshot
+from webhook import start_webhook_server
+
+logger = logging.getLogger("refresher")
+
+PublishedState = Tuple[int, Dict[str, ReadmeInfo]]
+
+
+def refresh(dashboard: GitHubProjectsDashboard, store: CatalogStore, path: str,
+            published: Optional[PublishedState]) -> Optional[PublishedState]:
+    """Bring the store up to date and publish it if it differs from the last snapshot"""
+    snapshot = store.get(dashboard.fetch_repositories)
+    if not snapshot.repos:
+        logger.warning("Crawl returned no repositories; keeping the previous snapshot")
+        return published
+
+    # Every README is revalidated in one batch, bounded by the GitHub client's concurrency cap
+    readme = store.readme_infos([repo['name'] for repo in snapshot.repos], dashboard.fetch_readme_infos)
+    state = (snapshot.version, readme)
+    if state == published:
+        return published
+
+    # Wall-clock nanoseconds keep versions increasing across refresher restarts
+    write_snapshot(path, snapshot.repos, readme, time.time_ns())
+    logger.info("Published %d repositories to %s", len(snapshot.repos), path)
+    return state
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--snapshot', default=os.getenv("CATALOG_SNAPSHOT_PATH"),
+                        help="snapshot file shared with the workers (default: $CATALOG_SNAPSHOT_PATH)")
+    parser.add_argument('--ttl', type=float, default=CATALOG_TTL_SECONDS,
+                        help="seconds before the organization and READMEs are fetched again")
+    parser.add_argument('--poll', type=float, default=5.0,
+                        help="seconds between checks for webhook changes or a stale catalog")
+    parser.add_argument('--once', action='store_true', help="publish one snapshot and exit")
+    args = parser.parse_args()
+    if not args.snapshot:
+        parser.error("--snapshot or CATALOG_SNAPSHOT_PATH must be set")
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
+    dashboard = GitHubProjectsDashboard()
+    store = CatalogStore(ttl=args.ttl)
+
+    # Webhooks patch this store; the next poll republishes the change to every worker
+    webhook_secret = os.getenv("WEBHOOK_SECRET")
+    if webhook_secret and not args.once:
+        start_webhook_server(ORG_NAME, webhook_secret, store=store)
+    metrics_port = os.getenv("METRICS_PORT")
+    if metrics_port and not args.once:
+        start_metrics_server(int(metrics_port))
+
+    if args.once:
+        # Let a failed one-off refresh exit non-zero
+        refresh(dashboard, store, args.snapshot, None)
+        return
+
+    published = None
+    while True:
+        # Workers keep serving the last published snapshot until a refresh succeeds again
+        try:
+            published = refresh(dashboard, store, args.snapshot, published)
+        except GitHubRequestError as e:
+            logger.warning("GitHub request failed, retrying in %ss: %s", args.poll, e)
+        except Exception:
+            logger.exception("Refresh failed, retrying in %ss", args.poll)
+        time.sleep(args.poll)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+import os
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from catalog import CatalogSnapshot, ReadmeInfo
+
+# Repository fields the dashboard reads; everything else in the GitHub payload is dropped
+REPO_SCHEMA = pa.schema([
+    ('id', pa.int64()),
+    ('name', pa.string()),
+    ('full_name', pa.string()),
+    ('html_url', pa.string()),
+    ('description', pa.string()),
+    ('homepage', pa.string()),
+    ('language', pa.string()),
+    ('topics', pa.list_(pa.string())),
+    ('stargazers_count', pa.int64()),
+    ('archived', pa.bool_()),
+    ('private', pa.bool_()),
+    ('fork', pa.bool_()),
+    ('default_branch', pa.string()),
+    ('created_at', pa.string()),
+    ('updated_at', pa.string()),
+    ('pushed_at', pa.string()),
+])
+
+# README metadata parsed by the refresher, one row per repository
+README_COLUMNS = [('readme_demo_url', pa.string()), ('readme_image_url', pa.string())]
+
+SNAPSHOT_SCHEMA = pa.schema(list(REPO_SCHEMA) + [pa.field(name, kind) for name, kind in README_COLUMNS])
+
+FileStamp = Tuple[int, int, int]
+
+
+def write_snapshot(path: str, repos: List[Dict], readme: Dict[str, ReadmeInfo], version: int) -> str:
+    """Atomically publish a catalog snapshot as an Arrow IPC file.
+
+    The file is written next to ``path`` and renamed over it, so readers
+    either see the previous snapshot or the complete new one. Readers that
+    still map the old file keep a valid view until they re-map.
+    """
+    columns = {name: [repo.get(name) for repo in repos] for name in REPO_SCHEMA.names}
+    infos = [readme.get(repo.get('name'), (None, None)) for repo in repos]
+    columns['readme_demo_url'] = [info[0] for info in infos]
+    columns['readme_image_url'] = [info[1] for info in infos]
+    table = pa.Table.from_pydict(columns, schema=SNAPSHOT_SCHEMA).replace_schema_metadata({
+        'version': str(version),
+        'published_at': repr(time.time()),
+    })
+
+    directory = os.path.dirname(os.path.abspath(path))
+    temp_path = os.path.join(directory, f".{os.path.basename(path)}.{os.getpid()}.tmp")
+    try:
+        with pa.OSFile(temp_path, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        with open(temp_path, 'rb') as written:
+            os.fsync(written.fileno())
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    return path
+
+
+class ArrowRepos(Sequence[Dict]):
+    """Repository rows of a mapped snapshot, turned into dicts only when read.
+
+    The table's buffers point into the memory map, so the catalog itself is
+    not copied into each worker.
+    """
+
+    def __init__(self, table: pa.Table):
+        self._table = table.select(REPO_SCHEMA.names)
+
+    def __len__(self) -> int:
+        return self._table.num_rows
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.take(list(range(*index.indices(len(self)))))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return self._table.slice(index, 1).to_pylist()[0]
+
+    def __iter__(self) -> Iterator[Dict]:
+        for batch in self._table.to_batches():
+            yield from batch.to_pylist()
+
+    def take(self, rows: List[int]) -> List[Dict]:
+        """Rows at the given positions, in that order"""
+        return self._table.take(rows).to_pylist() if rows else []
+
+    def columns(self, names: List[str]) -> Dict[str, List]:
+        """Whole columns as Python lists, for building an index"""
+        return {name: self._table.column(name).to_pylist() for name in names}
+
+    def matching_rows(self, query: str) -> List[int]:
+        """Positions of rows whose name or description contains ``query``, ignoring case"""
+        # Case-insensitive matching scans the mapped columns without writing lowercased copies
+        hits = pc.or_kleene(
+            pc.match_substring(self._table.column('name'), query, ignore_case=True),
+            pc.match_substring(self._table.column('description'), query, ignore_case=True),
+        )
+        return pc.indices_nonzero(hits.fill_null(False)).to_pylist()
+
+
+class ArrowReadme:
+    """README metadata of a mapped snapshot, looked up by repository name"""
+
+    def __init__(self, table: pa.Table):
+        self._names = table.column('name')
+        self._demo_urls = table.column('readme_demo_url')
+        self._image_urls = table.column('readme_image_url')
+
+    def get(self, repo_name: Optional[str], default: Optional[ReadmeInfo] = None) -> Optional[ReadmeInfo]:
+        if repo_name is None:
+            return default
+        row = pc.index(self._names, repo_name).as_py()
+        if row < 0:
+            return default
+        return self._demo_urls[row].as_py(), self._image_urls[row].as_py()
+
+
+class SnapshotReader:
+    """Read-only view of the snapshot file published by ``refresher.py``.
+
+    The file is memory-mapped, so every worker on the host shares one copy
+    of it in the page cache. It is re-mapped whenever the refresher renames a
+    new version into place.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._stamp: Optional[FileStamp] = None
+        self._snapshot: Optional[CatalogSnapshot] = None
+
+    def _file_stamp(self) -> Optional[FileStamp]:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def current(self) -> Optional[CatalogSnapshot]:
+        """The newest published snapshot, or ``None`` before the first publish"""
+        stamp = self._file_stamp()
+        if stamp is None or stamp == self._stamp:
+            return self._snapshot
+        with self._lock:
+            if stamp != self._stamp:
+                self._snapshot = self._load()
+                self._stamp = stamp
+        return self._snapshot
+
+    def _load(self) -> CatalogSnapshot:
+        source = pa.memory_map(self.path, 'r')
+        table = pa.ipc.open_file(source).read_all()
+        metadata = table.schema.metadata or {}
+        return CatalogSnapshot(
+            int(metadata.get(b'version', b'0')),
+            ArrowRepos(table),
+            float(metadata.get(b'published_at', b'0')),
+            readme=ArrowReadme(table),
+        )
@@ -0,0 +1,339 @@
+from functools import lru_cache
+
+FONT_AWESOME_LINK = (
+    '<link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0-beta3/css/all.min.css">'
+)
+
+# Card styles, shared by the page and the infinite-scroll grid's iframe
+CARD_CSS = """
+.repo-card {
+    background: rgba(255, 255, 255, 0.95);
+    backdrop-filter: blur(20px);
+    padding: 20px;
+    margin: 15px 10px;
+    border-radius: 20px;
+    box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+    transition: all 0.3s ease;
+    overflow: hidden;
+    height: 320px;
+    display: flex;
+    flex-direction: column;
+    border: 1px solid rgba(255,255,255,0.2);
+    position: relative;
+}
+
+.repo-card:hover {
+    transform: translateY(-8px);
+    box-shadow: 0 20px 50px rgba(0,0,0,0.15);
+}
+
+.repo-image {
+    width: 100%;
+    height: 100px;
+    object-fit: cover;
+    border-radius: 12px;
+    margin-bottom: 12px;
+    background: linear-gradient(135deg, #f3f4f6 0%, #e5e7eb 100%);
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    color: #9ca3af;
+    font-size: 12px;
+    border: 2px dashed #d1d5db;
+    flex-shrink: 0;
+}
+
+.repo-image img {
+    width: 100%;
+    height: 100%;
+    object-fit: cover;
+    border-radius: 12px;
+}
+
+.repo-content {
+    display: flex;
+    flex-direction: column;
+    flex-grow: 1;
+    min-height: 0;
+}
+
+.repo-card h3 {
+    margin: 0 0 8px 0;
+    color: #1f2937;
+    font-size: 16px;
+    font-weight: 600;
+    line-height: 1.3;
+    display: flex;
+    align-items: center;
+    gap: 8px;
+    flex-shrink: 0;
+}
+
+.repo-description {
+    color: #6b7280;
+    font-size: 13px;
+    line-height: 1.4;
+    flex-grow: 1;
+    overflow: hidden;
+    text-overflow: ellipsis;
+    display: -webkit-box;
+    -webkit-line-clamp: 3;
+    -webkit-box-orient: vertical;
+    margin-bottom: 12px;
+    min-height: 60px;
+}
+
+.repo-description.no-description {
+    color: #9ca3af;
+    font-style: italic;
+}
+
+.repo-footer {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    margin-top: auto;
+    padding-top: 12px;
+    border-top: 1px solid #e5e7eb;
+    flex-shrink: 0;
+}
+
+.icons {
+    display: flex;
+    gap: 10px;
+    margin-left: auto;
+}
+
+.icons a {
+    color: #6366f1;
+    transition: all 0.2s ease;
+    font-size: 16px;
+    text-decoration: none;
+    padding: 6px;
+    border-radius: 6px;
+    background: rgba(99, 102, 241, 0.1);
+    display: inline-flex;
+    align-items: center;
+    justify-content: center;
+    width: 32px;
+    height: 32px;
+}
+
+.icons a:hover {
+    color: white;
+    background: #6366f1;
+    transform: scale(1.1);
+}
+
+.icons span {
+    font-size: 16px;
+    color: #d1d5db;
+    padding: 6px;
+    border-radius: 6px;
+    background: rgba(209, 213, 219, 0.1);
+    display: inline-flex;
+    align-items: center;
+    justify-content: center;
+    width: 32px;
+    height: 32px;
+}
+
+.pagination {
+    display: flex;
+    justify-content: center;
+    align-items: center;
+    margin: 40px 0;
+    gap: 15px;
+    padding: 20px;
+    background: rgba(255, 255, 255, 0.95);
+    backdrop-filter: blur(20px);
+    border-radius: 20px;
+    box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+}
+
+.pagination-info {
+    color: #6b7280;
+    font-size: 14px;
+    font-weight: 500;
+    margin: 0 25px;
+    background: rgba(99, 102, 241, 0.1);
+    padding: 8px 16px;
+    border-radius: 20px;
+}
+
+.private-badge {
+    background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%);
+    color: white;
+    padding: 3px 8px;
+    border-radius: 12px;
+    font-size: 10px;
+    font-weight: 600;
+    text-transform: uppercase;
+    letter-spacing: 0.5px;
+    box-shadow: 0 2px 8px rgba(239, 68, 68, 0.3);
+    margin-left: auto;
+}
+
+.public-badge {
+    background: linear-gradient(135deg, #22c55e 0%, #16a34a 100%);
+    color: white;
+    padding: 3px 8px;
+    border-radius: 12px;
+    font-size: 10px;
+    font-weight: 600;
+    text-transform: uppercase;
+    letter-spacing: 0.5px;
+    box-shadow: 0 2px 8px rgba(34, 197, 94, 0.3);
+    margin-left: auto;
+}
+"""
+
+
+@lru_cache(maxsize=4)
+def page_styles(logo_base64: str) -> str:
+    """The page's <style> block; built once per process rather than on every rerun"""
+    return f"""
+            <style>
+            @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
+            
+            body {{
+                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+                font-family: 'Inter', sans-serif;
+                margin: 0;
+                padding: 0;
+            }}
+
+            .main > div {{
+                padding-top: 2rem;
+            }}
+
+            .header {{
+                background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%);
+                background-image: url("data:image/png;base64,{logo_base64}");
+                background-repeat: no-repeat;
+                background-position: center;
+                background-size: contain;
+                color: white;
+                padding: 60px 40px;
+                text-align: center;
+                border-radius: 20px;
+                margin-bottom: 40px;
+                box-shadow: 0 20px 40px rgba(0,0,0,0.1);
+            }}
+
+            .org-info {{
+                background: rgba(255, 255, 255, 0.95);
+                backdrop-filter: blur(20px);
+                padding: 40px;
+                border-radius: 20px;
+                margin-bottom: 40px;
+                box-shadow: 0 20px 40px rgba(0,0,0,0.1);
+                border: 1px solid rgba(255,255,255,0.2);
+            }}
+            
+            .org-info h2, .org-info h3 {{
+                color: #6366f1;
+                font-weight: 600;
+            }}
+
+            .filter-container {{
+                background: rgba(255, 255, 255, 0.95);
+                backdrop-filter: blur(20px);
+                padding: 30px;
+                border-radius: 20px;
+                margin-bottom: 30px;
+                box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+                border: 1px solid rgba(255,255,255,0.2);
+            }}
+
+            .filter-row {{
+                display: flex;
+                gap: 20px;
+                align-items: end;
+                flex-wrap: wrap;
+                margin-top: 20px;
+            }}
+
+            .filter-group {{
+                display: flex;
+                flex-direction: column;
+                gap: 8px;
+                min-width: 150px;
+            }}
+
+            .filter-label {{
+                font-weight: 600;
+                color: #374151;
+                font-size: 14px;
+                text-transform: uppercase;
+                letter-spacing: 0.5px;
+            }}
+
+            .search-container {{
+                margin-bottom: 25px;
+            }}
+
+            .search-container input {{
+                width: 100% !important;
+                padding: 16px 20px !important;
+                border: 2px solid #e5e7eb !important;
+                border-radius: 12px !important;
+                font-size: 16px !important;
+                background: rgba(255,255,255,0.9) !important;
+                transition: all 0.3s ease !important;
+            }}
+
+            .search-container input:focus {{
+                border-color: #6366f1 !important;
+                box-shadow: 0 0 0 3px rgba(99, 102, 241, 0.1) !important;
+                outline: none !important;
+            }}
+
+            {CARD_CSS}
+
+            .projects-title {{
+                color: #1f2937;
+                font-size: 32px;
+                font-weight: 700;
+                text-align: center;
+                margin-bottom: 30px;
+                background: linear-gradient(135deg, #6366f1 0%, #8b5cf6 100%);
+                -webkit-background-clip: text;
+                -webkit-text-fill-color: transparent;
+                background-clip: text;
+            }}
+
+            /* Streamlit specific overrides */
+            .stSelectbox > div > div > div {{
+                background: rgba(255,255,255,0.9) !important;
+                border: 2px solid #e5e7eb !important;
+                border-radius: 12px !important;
+                padding: 8px 12px !important;
+            }}
+
+            .stSelectbox > div > div > div:focus-within {{
+                border-color: #6366f1 !important;
+                box-shadow: 0 0 0 3px rgba(99, 102, 241, 0.1) !important;
+            }}
+
+            .stButton > button {{
+                background: linear-gradient(135deg, #6366f1 0%, #8b5cf6 100%) !important;
+                color: white !important;
+                border: none !important;
+                border-radius: 12px !important;
+                padding: 10px 20px !important;
+                font-weight: 600 !important;
+                transition: all 0.3s ease !important;
+                box-shadow: 0 4px 15px rgba(99, 102, 241, 0.3) !important;
+            }}
+
+            .stButton > button:hover {{
+                transform: translateY(-2px) !important;
+                box-shadow: 0 8px 25px rgba(99, 102, 241, 0.4) !important;
+            }}
+
+            div[data-testid="stSidebar"] {{
+                display: none;
+            }}
+            </style>
+            """
@@ -1,9 +1,10 @@
 import os
-import requests
 import streamlit as st
 from typing import List, Dict
 from dotenv import load_dotenv
 
+from github_client import GitHubRequestError, get_github_client
+
 # Load environment variables
 load_dotenv()
 
@@ -26,52 +27,46 @@ class GitHubOrgFetcher:
     def fetch_org_repos(self) -> List[Dict]:
         """Fetch all repositories from the organization with their details"""
         all_repos = []
-        page = 1
-
-        while True:
-            url = f'https://api.github.com/orgs/{self.org_name}/repos'
-            params = {
-                'type': 'all',
-                'sort': 'updated',
-                'direction': 'desc',
-                'per_page': 100,
-                'page': page
-            }
-
-            try:
-                response = requests.get(url, headers=self.headers, params=params)
-                response.raise_for_status()
-                
-                repos = response.json()
-                if not repos:
-                    break
-
-                # Extract relevant information from each repository
-                for repo in repos:
-                    repo_info = {
-                        'name': repo.get('name'),
-                        'description': repo.get('description'),
-                        'homepage': repo.get('homepage'),
-                        'topics': repo.get('topics', []),
-                        'html_url': repo.get('html_url'),
-                        'created_at': repo.get('created_at'),
-                        'updated_at': repo.get('updated_at'),
-                        'visibility': repo.get('visibility'),
-                        'default_branch': repo.get('default_branch'),
-                        'language': repo.get('language')
-                    }
-                    all_repos.append(repo_info)
+        url = f'https://api.github.com/orgs/{self.org_name}/repos'
+        params = {
+            'type': 'all',
+            'sort': 'updated',
+            'direction': 'desc',
+            'per_page': 100,
+        }
 
-                page += 1
+        try:
+            # Pages after the first are requested concurrently
+            responses = get_github_client().fetch_pages(url, self.headers, params)
+        except GitHubRequestError as e:
+            print(f"Error fetching repositories: {e}")
+            return all_repos
 
-            except requests.exceptions.RequestException as e:
-                print(f"Error fetching repositories: {e}")
+        for response in responses:
+            if response.status_code != 200:
+                print(f"Error fetching repositories: HTTP {response.status_code}")
                 if response.status_code == 401:
                     print("Authentication failed. Please check your GitHub token.")
                 elif response.status_code == 403:
                     print("API rate limit exceeded or insufficient permissions.")
                 break
 
+            # Extract relevant information from each repository
+            for repo in response.json():
+                repo_info = {
+                    'name': repo.get('name'),
+                    'description': repo.get('description'),
+                    'homepage': repo.get('homepage'),
+                    'topics': repo.get('topics', []),
+                    'html_url': repo.get('html_url'),
+                    'created_at': repo.get('created_at'),
+                    'updated_at': repo.get('updated_at'),
+                    'visibility': repo.get('visibility'),
+                    'default_branch': repo.get('default_branch'),
+                    'language': repo.get('language')
+                }
+                all_repos.append(repo_info)
+
         return all_repos
 
 def main():
@@ -0,0 +1,227 @@
+import argparse
+import hashlib
+import hmac
+import json
+import os
+import threading
+import uuid
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Dict, Optional
+
+from assets import load_environment
+from catalog import CatalogStore, get_catalog_store
+
+if TYPE_CHECKING:
+    import requests
+
+# Load environment variables from .env file
+load_environment()
+
+WEBHOOK_HOST = os.getenv("WEBHOOK_HOST", "127.0.0.1")
+WEBHOOK_PORT = int(os.getenv("WEBHOOK_PORT", "8765"))
+SUPPORTED_EVENTS = ("repository", "push", "public")
+# GitHub caps webhook payloads at 25 MB; anything larger is not a delivery
+MAX_PAYLOAD_BYTES = 25 * 1024 * 1024
+
+# Timestamps that push payloads send as epoch seconds instead of ISO-8601
+_EPOCH_FIELDS = ("created_at", "pushed_at")
+
+_server: Optional[ThreadingHTTPServer] = None
+_server_lock = threading.Lock()
+
+
+def sign_payload(secret: str, body: bytes) -> str:
+    """Compute the ``X-Hub-Signature-256`` header value for a payload"""
+    digest = hmac.new(secret.encode('utf-8'), body, hashlib.sha256).hexdigest()
+    return f"sha256={digest}"
+
+
+def verify_signature(secret: str, body: bytes, signature: Optional[str]) -> bool:
+    """Check a delivery's ``X-Hub-Signature-256`` header in constant time"""
+    if not signature:
+        return False
+    return hmac.compare_digest(sign_payload(secret, body), signature)
+
+
+def _normalize_repository(repo: Dict) -> Dict:
+    """Bring a webhook repository object in line with the REST listing format"""
+    repo = dict(repo)
+    for key in _EPOCH_FIELDS:
+        value = repo.get(key)
+        if isinstance(value, (int, float)):
+            repo[key] = datetime.fromtimestamp(value, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    return repo
+
+
+def _touches_readme(payload: Dict) -> bool:
+    """Whether a push to the default branch may have changed the README"""
+    repo = payload.get('repository', {})
+    if payload.get('ref') != f"refs/heads/{repo.get('default_branch')}":
+        return False
+    commits = payload.get('commits') or []
+    # GitHub lists at most 20 commits per delivery; assume the worst beyond that
+    if not commits or len(commits) >= 20:
+        return True
+    for commit in commits:
+        for path in commit.get('added', []) + commit.get('modified', []) + commit.get('removed', []):
+            if os.path.basename(path).lower().startswith('readme'):
+                return True
+    return False
+
+
+def handle_event(store: CatalogStore, org_name: str, event: str, payload: Dict) -> str:
+    """Apply a single webhook delivery to the catalog and return a short summary"""
+    if event == 'ping':
+        return 'pong'
+    if event not in SUPPORTED_EVENTS:
+        return f'ignored {event} event'
+
+    repo = payload.get('repository') or {}
+    repo_name = repo.get('name')
+    owner = (repo.get('owner') or {}).get('login', '')
+    if not repo_name or owner.lower() != org_name.lower():
+        return 'ignored repository outside the organization'
+
+    if event == 'repository':
+        action = payload.get('action')
+        # GitHub sends "transferred" only to the new owner, so it means the repository just
+        # arrived and is upserted below; repositories that leave are dropped by the next crawl
+        if action == 'deleted':
+            store.remove(repo_name)
+            return f'removed {repo_name}'
+        if action == 'renamed':
+            old_name = payload.get('changes', {}).get('repository', {}).get('name', {}).get('from')
+            if old_name:
+                store.invalidate_readme(old_name)
+        updated = store.upsert(_normalize_repository(repo))
+        store.invalidate_readme(repo_name)
+        return f'updated {repo_name} ({action})' if updated else _skipped(repo_name)
+
+    if event == 'public':
+        if not store.upsert(_normalize_repository(repo)):
+            return _skipped(repo_name)
+        return f'updated {repo_name} (public)'
+
+    # push
+    updated = store.upsert(_normalize_repository(repo))
+    if _touches_readme(payload):
+        store.invalidate_readme(repo_name)
+        return f'updated {repo_name} and its README' if updated else _skipped(repo_name)
+    return f'updated {repo_name}' if updated else _skipped(repo_name)
+
+
+def _skipped(repo_name: str) -> str:
+    # upsert() has nothing to patch before the first crawl, which will include the repository anyway
+    return f'skipped {repo_name}: no catalog loaded yet'
+
+
+class WebhookHandler(BaseHTTPRequestHandler):
+    """Receives GitHub webhook deliveries and patches the shared catalog"""
+
+    store: CatalogStore = None
+    secret: str = ''
+    org_name: str = ''
+
+    def do_POST(self):
+        # Check the length before reading: the body is buffered before its signature can be checked
+        try:
+            length = int(self.headers.get('Content-Length'))
+        except (TypeError, ValueError):
+            length = -1
+        if length < 0:
+            self._respond(400, 'missing or invalid Content-Length')
+            return
+        if length > MAX_PAYLOAD_BYTES:
+            self._respond(413, 'payload too large')
+            return
+        body = self.rfile.read(length)
+
+        if not verify_signature(self.secret, body, self.headers.get('X-Hub-Signature-256')):
+            self._respond(401, 'invalid signature')
+            return
+
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            self._respond(400, 'invalid JSON payload')
+            return
+        if not isinstance(payload, dict):
+            self._respond(400, 'payload must be a JSON object')
+            return
+
+        event = self.headers.get('X-GitHub-Event', '')
+        try:
+            summary = handle_event(self.store, self.org_name, event, payload)
+        except (AttributeError, TypeError) as e:
+            # Nested fields of the wrong shape, e.g. "repository": [...]
+            self._respond(400, f'malformed {event} payload: {e}')
+            return
+        self._respond(200, summary)
+
+    def _respond(self, status: int, message: str):
+        body = message.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/plain; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Keep deliveries out of the Streamlit console
+
+
+def start_webhook_server(org_name: str, secret: str, store: Optional[CatalogStore] = None,
+                         host: str = WEBHOOK_HOST, port: int = WEBHOOK_PORT) -> ThreadingHTTPServer:
+    """Start the receiver on a daemon thread, once per process"""
+    global _server
+    if not secret:
+        raise ValueError("A webhook secret is required to verify deliveries")
+    with _server_lock:
+        if _server is None:
+            handler = type('BoundWebhookHandler', (WebhookHandler,), {
+                'store': store or get_catalog_store(),
+                'secret': secret,
+                'org_name': org_name,
+            })
+            _server = ThreadingHTTPServer((host, port), handler)
+            threading.Thread(target=_server.serve_forever, name='webhook-server', daemon=True).start()
+        return _server
+
+
+def replay(path: str, event: str, url: str, secret: str) -> 'requests.Response':
+    """Post a recorded delivery to a running receiver, signed like GitHub would"""
+    # Only the replay command sends requests; the receiver itself never needs them
+    import requests
+
+    with open(path, 'rb') as payload_file:
+        body = payload_file.read()
+    headers = {
+        'Content-Type': 'application/json',
+        'X-GitHub-Event': event,
+        'X-GitHub-Delivery': str(uuid.uuid4()),
+        'X-Hub-Signature-256': sign_payload(secret, body),
+    }
+    return requests.post(url, data=body, headers=headers)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GitHub webhook receiver for the projects dashboard")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    replay_parser = subparsers.add_parser('replay', help="post a recorded event payload to a receiver")
+    replay_parser.add_argument('payload', help="path to a recorded JSON payload")
+    replay_parser.add_argument('--event', required=True, choices=SUPPORTED_EVENTS + ('ping',))
+    replay_parser.add_argument('--url', default=f"http://{WEBHOOK_HOST}:{WEBHOOK_PORT}/")
+
+    args = parser.parse_args()
+    secret = os.getenv("WEBHOOK_SECRET", "")
+    if not secret:
+        parser.error("WEBHOOK_SECRET must be set")
+
+    response = replay(args.payload, args.event, args.url, secret)
+    print(f"{response.status_code}: {response.text}")
+
+
+if __name__ == "__main__":
+    main()